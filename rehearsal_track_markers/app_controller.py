@@ -1,13 +1,23 @@
 """Application controller coordinating UI, data models, and audio playback."""
 
-import json
+import os
+from collections.abc import Callable
 from pathlib import Path
 
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import (
+    QCoreApplication,
+    QObject,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+    Slot,
+)
 from PySide6.QtWidgets import QFileDialog
 
+from . import __version__
 from .audio import AudioFileManager, AudioPlayer
-from .models import Marker, Show
+from .models import Marker, Show, Track
 from .persistence import FileManager, ShowRepository
 from .ui import MainWindow
 from .ui.dialogs import (
@@ -20,19 +30,39 @@ from .ui.dialogs import (
     show_info,
     show_warning,
 )
+from .utils import fastjson
 from .utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+_BASE_TITLE = "Rehearsal Track Marker"
+
+_ABOUT_MESSAGE = (
+    f"{_BASE_TITLE} v{__version__}\n\n"
+    "A musical theatre rehearsal tool for adding timestamped markers "
+    "to audio tracks and quickly jumping to specific locations.\n\n"
+    "Built with PySide6 and Qt Multimedia."
+)
+
 
-class AppController:
+class AppController(QObject):
     """
     Main application controller.
 
     Coordinates between UI components, data models, and audio playback engine.
     Manages application state and user interactions.
+
+    Handlers are declared as Qt slots so connections resolve against the
+    meta-object and are dispatched without the generic Python trampoline.
     """
 
+    # Emitted from a worker thread with the result of an audio file check
+    _track_file_checked = Signal(object, bool)  # (track, exists)
+    # Emitted from the save thread when a background auto-save completes
+    _auto_save_finished = Signal(object, int, str)  # (show, generation, error)
+    # Emitted from the copy thread once a batch of audio files is copied
+    _audio_files_copied = Signal(object, object, object)  # (show, tracks, errors)
+
     def __init__(self, main_window: MainWindow) -> None:
         """
         Initialize the application controller.
@@ -40,11 +70,19 @@ class AppController:
         Args:
             main_window: The main application window
         """
+        super().__init__(main_window)
+
         self._main_window = main_window
         self._current_show: Show | None = None
         self._current_track_index: int = -1
+        # Track at _current_track_index; None whenever no track is active
+        self._current_track: Track | None = None
+        # Track selected in the sidebar whose audio file check is in flight;
+        # it only becomes current once the check result arrives
+        self._pending_track: Track | None = None
         self._show_file_path: Path | None = None  # Path to current show JSON file
         self._is_modified = False  # Track unsaved changes
+        self._last_window_title = ""  # Last title pushed to the window
 
         # Initialize managers
         self._file_manager = FileManager()
@@ -52,6 +90,14 @@ class AppController:
         self._show_repository = ShowRepository(self._file_manager)
         self._audio_player = AudioPlayer()
 
+        # Dialog start directories don't change while the app runs
+        self._home_dir = str(Path.home())
+        self._shows_dir = str(self._file_manager.get_shows_directory())
+        try:
+            self._file_manager.ensure_base_directories()
+        except OSError as e:
+            logger.error(f"Failed to create shows directory: {e}")
+
         # Setup auto-save debounce timer
         # Debounced auto-save triggers 500ms after any change
         # This makes saves feel instant while preventing excessive writes during rapid edits
@@ -59,11 +105,51 @@ class AppController:
         self._auto_save_timer.timeout.connect(self._on_auto_save)
         self._auto_save_timer.setSingleShot(True)  # Only fire once per start
         self._auto_save_debounce_ms = 500  # 500ms after last change
+        # Marker renames and nudges come in bursts (held arrow keys), so they
+        # wait longer before writing to fold a whole burst into one save
+        self._marker_edit_debounce_ms = 1000
+
+        # Auto-saves are written on a single background thread so disk
+        # latency never stalls the UI; the show is snapshotted beforehand
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        self._save_in_flight = False
+        self._save_pending = False  # Timer fired while a save was running
+        self._change_generation = 0  # Bumped on every modification
+
+        # Audio files are copied into app storage on their own thread; one
+        # batch at a time so concurrent batches cannot race on file names
+        self._copy_pool = QThreadPool(self)
+        self._copy_pool.setMaxThreadCount(1)
+
+        # Coalesce audio position ticks to roughly the display refresh rate
+        # Only the latest position is drawn; intermediate ticks are dropped
+        self._pending_position_ms: int | None = None
+        self._duration_ms = 0  # Cached from duration_changed
+        self._position_update_timer = QTimer(self)
+        self._position_update_timer.timeout.connect(self._flush_position_update)
+        self._position_update_timer.setSingleShot(True)
+        self._position_update_timer.setInterval(16)  # ~60 Hz
+
+        # Throttle seeks while scrubbing; the last position of a drag always lands
+        self._pending_seek_ms: int | None = None
+        self._seek_timer = QTimer(self)
+        self._seek_timer.timeout.connect(self._flush_seek)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(30)
 
         # Connect signals
         self._connect_menu_actions()
         self._connect_ui_signals()
         self._connect_audio_player_signals()
+        self._track_file_checked.connect(self._on_track_file_checked)
+        self._auto_save_finished.connect(self._on_auto_save_finished)
+        self._audio_files_copied.connect(self._on_audio_files_copied)
+
+        # Write out edits still waiting on the debounce when the app exits
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_pending_save)
 
         # Show welcome screen initially (no show loaded yet)
         self._main_window.show_welcome_screen()
@@ -95,7 +181,7 @@ class AppController:
         self._main_window.welcome_screen.open_show_requested.connect(self._on_open_show)
 
         # Main window keyboard shortcuts
-        self._main_window.space_pressed.connect(self._on_toggle_play_pause)
+        self._main_window.space_pressed.connect(self._audio_player.toggle_play_pause)
         self._main_window.m_key_pressed.connect(self._on_add_marker)
         self._main_window.arrow_left_pressed.connect(self._on_nudge_marker_backward)
         self._main_window.arrow_right_pressed.connect(self._on_nudge_marker_forward)
@@ -107,9 +193,13 @@ class AppController:
             self._on_remove_track
         )
 
-        # Playback controls
-        self._main_window.playback_controls.play_clicked.connect(self._on_play)
-        self._main_window.playback_controls.pause_clicked.connect(self._on_pause)
+        # Playback controls (simple transport actions go straight to the player)
+        self._main_window.playback_controls.play_clicked.connect(
+            self._audio_player.play
+        )
+        self._main_window.playback_controls.pause_clicked.connect(
+            self._audio_player.pause
+        )
         self._main_window.playback_controls.skip_forward_clicked.connect(
             self._on_skip_forward
         )
@@ -139,6 +229,7 @@ class AppController:
 
     # Show Management (4.1)
 
+    @Slot()
     def _on_new_show(self) -> None:
         """Handle New Show menu action."""
         logger.info("New show requested")
@@ -156,6 +247,8 @@ class AppController:
             # Create new show
             self._current_show = Show(name=show_name)
             self._current_track_index = -1
+            self._current_track = None
+            self._pending_track = None
             self._is_modified = True
 
             # Create show directories
@@ -174,6 +267,7 @@ class AppController:
                 f'New show "{show_name}" created successfully.',
             )
 
+    @Slot()
     def _on_open_show(self) -> None:
         """Handle Open Show menu action."""
         logger.info("Open show requested")
@@ -183,19 +277,15 @@ class AppController:
             return
 
         # Show file dialog
-        shows_dir = self._file_manager.get_shows_directory()
-        shows_dir.mkdir(parents=True, exist_ok=True)
-
-        file_path, _ = QFileDialog.getOpenFileName(
-            self._main_window,
+        self._open_file_dialog(
             "Open Show",
-            str(shows_dir),
+            self._shows_dir,
             "Show Files (*.json);;All Files (*)",
+            QFileDialog.FileMode.ExistingFile,
+            lambda file_paths: self._load_show(Path(file_paths[0])),
         )
 
-        if file_path:
-            self._load_show(Path(file_path))
-
+    @Slot()
     def _on_save_show(self) -> None:
         """Handle Save Show menu action."""
         if self._current_show is None:
@@ -205,6 +295,7 @@ class AppController:
         # Always save to proper app storage location
         self._save_show()
 
+    @Slot()
     def _on_save_show_as(self) -> None:
         """Handle Save Show As menu action (rename show)."""
         if self._current_show is None:
@@ -232,6 +323,7 @@ class AppController:
 
             logger.info(f"Show renamed from '{old_name}' to '{new_name}'")
 
+    @Slot()
     def _on_export_show(self) -> None:
         """Handle Export Show menu action."""
         if self._current_show is None:
@@ -246,19 +338,19 @@ class AppController:
         logger.info("Export show requested")
 
         # Show file dialog for export location
-        suggested_name = self._current_show.name.replace(" ", "_") + ".json"
-        default_path = str(Path.home() / suggested_name)
+        suggested_name = self._current_show.name.replace(" ", "_")
+        default_path = os.path.join(self._home_dir, f"{suggested_name}.json")
 
-        file_path, _ = QFileDialog.getSaveFileName(
-            self._main_window,
+        self._open_file_dialog(
             "Export Show",
             default_path,
             "Show Files (*.json);;All Files (*)",
+            QFileDialog.FileMode.AnyFile,
+            lambda file_paths: self._export_show(Path(file_paths[0])),
+            accept_mode=QFileDialog.AcceptMode.AcceptSave,
         )
 
-        if file_path:
-            self._export_show(Path(file_path))
-
+    @Slot()
     def _on_import_show(self) -> None:
         """Handle Import Show menu action."""
         logger.info("Import show requested")
@@ -268,15 +360,56 @@ class AppController:
             return
 
         # Show file dialog
-        file_path, _ = QFileDialog.getOpenFileName(
-            self._main_window,
+        self._open_file_dialog(
             "Import Show",
-            str(Path.home()),
+            self._home_dir,
             "Show Files (*.json);;All Files (*)",
+            QFileDialog.FileMode.ExistingFile,
+            lambda file_paths: self._import_show(Path(file_paths[0])),
         )
 
-        if file_path:
-            self._import_show(Path(file_path))
+    def _open_file_dialog(
+        self,
+        caption: str,
+        directory: str,
+        name_filter: str,
+        file_mode: QFileDialog.FileMode,
+        on_accepted: Callable[[list[str]], None],
+        accept_mode: QFileDialog.AcceptMode = QFileDialog.AcceptMode.AcceptOpen,
+        on_rejected: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Open a window-modal file dialog without blocking in a nested event loop.
+
+        The dialog deletes itself when closed. If the user accepts a selection,
+        ``on_accepted`` is called with the selected paths after the dialog has
+        been hidden.
+
+        Args:
+            caption: Dialog title
+            directory: Start directory, or a file path to preselect
+            name_filter: File type filters separated by ";;"
+            file_mode: What the user may select
+            on_accepted: Called with the non-empty list of selected paths
+            accept_mode: Whether the dialog opens or saves files
+            on_rejected: Optional callback for when the user cancels
+        """
+        dialog = QFileDialog(self._main_window, caption, directory, name_filter)
+        dialog.setFileMode(file_mode)
+        dialog.setAcceptMode(accept_mode)
+        if file_mode == QFileDialog.FileMode.Directory:
+            dialog.setOption(QFileDialog.Option.ShowDirsOnly)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+
+        def handle_accepted() -> None:
+            file_paths = dialog.selectedFiles()
+            if file_paths:
+                on_accepted(file_paths)
+
+        dialog.accepted.connect(handle_accepted)
+        if on_rejected is not None:
+            dialog.rejected.connect(on_rejected)
+        dialog.open()
 
     def _export_show(self, export_path: Path) -> None:
         """
@@ -325,40 +458,57 @@ class AppController:
 
         Note:
             Expects audio files to be in an "audio" subdirectory next to the JSON file.
+            If it is missing, the user is asked to locate the audio directory.
             Audio files will be copied to app storage.
         """
-        try:
-            logger.info(f"Importing show from: {import_path}")
+        logger.info(f"Importing show from: {import_path}")
 
-            # Check if audio directory exists
-            audio_dir = import_path.parent / "audio"
-            if not audio_dir.exists():
-                # Ask user to locate audio directory
-                audio_dir_str = QFileDialog.getExistingDirectory(
-                    self._main_window,
-                    "Locate Audio Files Directory",
-                    str(import_path.parent),
-                    QFileDialog.Option.ShowDirsOnly,
-                )
+        # Check if audio directory exists
+        audio_dir = import_path.parent / "audio"
+        if audio_dir.exists():
+            self._import_show_with_audio(import_path, audio_dir)
+            return
 
-                if not audio_dir_str:
-                    show_warning(
-                        self._main_window,
-                        "Import Cancelled",
-                        "Audio files directory not selected. Import cancelled.",
-                    )
-                    return
+        # Ask user to locate audio directory
+        self._open_file_dialog(
+            "Locate Audio Files Directory",
+            str(import_path.parent),
+            "",
+            QFileDialog.FileMode.Directory,
+            lambda dir_paths: self._import_show_with_audio(
+                import_path, Path(dir_paths[0])
+            ),
+            on_rejected=lambda: show_warning(
+                self._main_window,
+                "Import Cancelled",
+                "Audio files directory not selected. Import cancelled.",
+            ),
+        )
 
-                audio_dir = Path(audio_dir_str)
+    def _import_show_with_audio(self, import_path: Path, audio_dir: Path) -> None:
+        """
+        Import a show from a file, copying its audio into app storage.
 
+        Args:
+            import_path: Path to the show JSON file to import
+            audio_dir: Directory containing the show's audio files
+        """
+        try:
             # Import show from the file path
             show = self._show_repository.import_show(import_path, audio_dir)
 
             # Copy audio files to app storage
+            present_files = self._file_manager.snapshot_dir(audio_dir)
             for track in show.tracks:
                 source_audio_path = audio_dir / track.filename
 
-                if not source_audio_path.exists():
+                # The listing answers the common case; anything it misses
+                # (case or Unicode-form differences, subdirectories) gets
+                # an authoritative stat
+                if (
+                    track.filename not in present_files
+                    and not source_audio_path.exists()
+                ):
                     show_warning(
                         self._main_window,
                         "Audio File Missing",
@@ -384,12 +534,15 @@ class AppController:
                     )
 
             # Save the imported show
+            self._save_pool.waitForDone()
             self._show_repository.save(show)
 
             # Load the imported show
             self._current_show = show
             self._show_file_path = self._file_manager.get_show_file_path(show.name)
             self._current_track_index = -1
+            self._current_track = None
+            self._pending_track = None
             self._is_modified = False
 
             # Update UI
@@ -411,7 +564,7 @@ class AppController:
                 f"Import file not found: {e}",
             )
 
-        except json.JSONDecodeError as e:
+        except fastjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON in import file: {e}")
             show_error(
                 self._main_window,
@@ -452,6 +605,8 @@ class AppController:
             self._current_show = show
             self._show_file_path = file_path
             self._current_track_index = -1
+            self._current_track = None
+            self._pending_track = None
             self._is_modified = False
 
             # Update UI
@@ -482,6 +637,10 @@ class AppController:
         if self._current_show is None:
             return
 
+        # Let a background auto-save finish so writes cannot interleave
+        self._auto_save_timer.stop()
+        self._save_pool.waitForDone()
+
         try:
             logger.info(f"Saving show: {self._current_show.name}")
 
@@ -546,8 +705,9 @@ class AppController:
         self._main_window.show_main_ui()
 
         # Update track sidebar
-        track_names = [track.filename for track in self._current_show.tracks]
-        self._main_window.track_sidebar.set_tracks(track_names)
+        self._main_window.track_sidebar.set_tracks(
+            track.filename for track in self._current_show.tracks
+        )
 
         # Update skip increment buttons
         skip_seconds = self._current_show.settings.skip_increment_seconds
@@ -559,19 +719,21 @@ class AppController:
 
     def _update_window_title(self) -> None:
         """Update the main window title to reflect current show."""
-        base_title = "Rehearsal Track Marker"
-
         if self._current_show is None:
-            self._main_window.setWindowTitle(base_title)
+            title = _BASE_TITLE
         else:
             show_name = self._current_show.name
             modified_marker = "*" if self._is_modified else ""
-            self._main_window.setWindowTitle(
-                f"{base_title} - {show_name}{modified_marker}"
-            )
+            title = f"{_BASE_TITLE} - {show_name}{modified_marker}"
+
+        # Skip the native title update when nothing visible changed
+        if title != self._last_window_title:
+            self._last_window_title = title
+            self._main_window.setWindowTitle(title)
 
     # Track Management (4.2)
 
+    @Slot()
     def _on_add_track(self) -> None:
         """Handle Add Track button click."""
         if self._current_show is None:
@@ -585,62 +747,120 @@ class AppController:
         logger.info("Add track requested")
 
         # Show file dialog
-        file_paths, _ = QFileDialog.getOpenFileNames(
-            self._main_window,
+        self._open_file_dialog(
             "Add Audio Files",
-            str(Path.home()),
+            self._home_dir,
             "Audio Files (*.mp3 *.wav *.m4a *.flac *.ogg);;All Files (*)",
+            QFileDialog.FileMode.ExistingFiles,
+            self._add_audio_files,
         )
 
-        for file_path_str in file_paths:
-            self._add_audio_file(Path(file_path_str))
-
-    def _add_audio_file(self, file_path: Path) -> None:
+    def _add_audio_files(self, file_paths: list[str]) -> None:
         """
-        Add an audio file to the current show.
+        Add the audio files chosen in the Add Audio Files dialog.
 
         Args:
-            file_path: Path to the audio file
+            file_paths: Paths of the selected files
         """
         if self._current_show is None:
             return
 
-        try:
-            logger.info(f"Adding audio file: {file_path}")
-
-            # Check if file is supported
-            if not self._audio_file_manager.is_supported_format(file_path):
-                show_error(
-                    self._main_window,
-                    "Unsupported Format",
-                    f"Audio format not supported: {file_path.suffix}",
-                )
-                return
+        # Filter out unsupported formats up front and report them together
+        supported: list[Path] = []
+        rejected: list[str] = []
+        for file_path_str in file_paths:
+            if self._audio_file_manager.is_supported_format(file_path_str):
+                supported.append(Path(file_path_str))
+            else:
+                rejected.append(os.path.basename(file_path_str))
 
-            # Add file to show
-            track = self._audio_file_manager.add_audio_file_to_show(
-                file_path, self._current_show.name
+        if rejected:
+            show_error(
+                self._main_window,
+                "Unsupported Format",
+                "The following files are not in a supported audio format "
+                "and were skipped:\n\n" + "\n".join(rejected),
             )
 
-            # Add track to show model
-            self._current_show.add_track(track)
+        if not supported:
+            return
 
-            # Update UI
-            self._main_window.track_sidebar.add_track(track.filename)
+        # Copy on a worker thread; large files would otherwise freeze the UI
+        show = self._current_show
+        show_name = show.name
+        audio_file_manager = self._audio_file_manager
 
-            # Trigger auto-save
-            self._trigger_auto_save()
+        def copy_audio_files() -> None:
+            tracks: list[Track] = []
+            errors: list[str] = []
+            for file_path in supported:
+                try:
+                    logger.info(f"Adding audio file: {file_path}")
+                    tracks.append(
+                        audio_file_manager.add_audio_file_to_show(file_path, show_name)
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to add track: {e}")
+                    errors.append(f"{file_path.name}: {e}")
+            try:
+                self._audio_files_copied.emit(show, tracks, errors)
+            except RuntimeError:
+                # Controller destroyed at shutdown
+                pass
+
+        # Keep the show in place until the copied files are attached to it
+        self._main_window.set_busy(f"Copying {len(supported)} audio file(s)...")
+        self._copy_pool.start(copy_audio_files)
+
+    @Slot(object, object, object)
+    def _on_audio_files_copied(
+        self, show: Show, tracks: list[Track], errors: list[str]
+    ) -> None:
+        """
+        Add copied audio files to the show once the copy thread is done.
 
-            logger.info(f"Track added successfully: {track.filename}")
+        Args:
+            show: The show the files were copied for
+            tracks: Tracks for the files that were copied successfully
+            errors: Messages for the files that could not be copied
+        """
+        self._main_window.set_busy(None)
 
-        except Exception as e:
-            logger.error(f"Failed to add track: {e}")
+        if errors:
             show_error(
                 self._main_window,
                 "Add Track Failed",
-                f"Failed to add track: {e}",
+                "Failed to add track:\n\n" + "\n".join(errors),
             )
 
+        if show is not self._current_show:
+            # The show was replaced while copying; remove the copies nothing
+            # will reference. Files the show already used were only matched,
+            # not copied, and are kept.
+            logger.warning(f"Discarding {len(tracks)} track(s) copied for {show.name}")
+            in_use = {track.audio_path for track in show.tracks}
+            for track in tracks:
+                if track.audio_path not in in_use:
+                    try:
+                        self._audio_file_manager.delete_audio_file(track.audio_path)
+                    except OSError as e:
+                        logger.error(f"Failed to delete {track.audio_path}: {e}")
+            return
+
+        if not tracks:
+            return
+
+        # Add tracks to the model first, then refresh the UI once
+        for track in tracks:
+            show.add_track(track)
+            logger.info(f"Track added successfully: {track.filename}")
+
+        self._main_window.track_sidebar.add_tracks(track.filename for track in tracks)
+
+        # Trigger auto-save
+        self._trigger_auto_save()
+
+    @Slot(int)
     def _on_track_selected(self, index: int) -> None:
         """
         Handle track selection change.
@@ -653,26 +873,60 @@ class AppController:
 
         logger.info(f"Track selected: index {index}")
 
-        self._current_track_index = index
         track = self._current_show.get_track(index)
+        self._pending_track = track
 
         if track is None:
             return
 
+        # Stat the audio file on a worker thread; slow or network storage
+        # would otherwise block the UI while switching tracks
+        audio_path = track.audio_path
+
+        def check_audio_file() -> None:
+            self._track_file_checked.emit(track, audio_path.exists())
+
+        QThreadPool.globalInstance().start(check_audio_file)
+
+    @Slot(object, bool)
+    def _on_track_file_checked(self, track: Track, exists: bool) -> None:
+        """
+        Finish selecting a track once its audio file has been checked.
+
+        Args:
+            track: The track whose audio file was checked
+            exists: Whether the audio file exists
+        """
+        if track is not self._pending_track or self._current_show is None:
+            # Selection changed while the check was running
+            return
+
+        self._pending_track = None
+
         # Load audio file
-        if track.audio_path.exists():
+        if exists:
+            # Marker actions keep targeting the previous track, whose markers
+            # are still displayed, until this point
+            self._current_track_index = next(
+                i for i, t in enumerate(self._current_show.tracks) if t is track
+            )
+            self._current_track = track
+            self._duration_ms = 0
             self._audio_player.load_file(track.audio_path)
 
             # Update UI
             self._main_window.playback_controls.set_track_title(track.filename)
 
             # Update marker list
-            markers = [(m.name, m.timestamp_ms) for m in track.markers]
-            self._main_window.marker_list.set_markers(markers)
+            self._main_window.marker_list.set_markers(
+                (m.name, m.timestamp_ms) for m in track.markers
+            )
 
             # Update marker visualization on progress bar
-            marker_positions = [m.timestamp_ms for m in track.markers]
-            self._main_window.playback_controls.set_markers(marker_positions)
+            self._main_window.playback_controls.set_markers(track.marker_positions)
+
+            # Warm neighbouring tracks so switching to them starts quickly
+            self._prefetch_adjacent_tracks(self._current_track_index)
 
         else:
             logger.error(f"Audio file not found: {track.audio_path}")
@@ -682,6 +936,30 @@ class AppController:
                 f"Audio file not found: {track.audio_path}",
             )
 
+    def _prefetch_adjacent_tracks(self, index: int) -> None:
+        """
+        Read the start of the next and previous tracks' audio in the background.
+
+        Args:
+            index: Index of the track that was just loaded
+        """
+        if self._current_show is None:
+            return
+
+        tracks = self._current_show.tracks
+        paths = [
+            tracks[i].audio_path for i in (index + 1, index - 1) if 0 <= i < len(tracks)
+        ]
+        if not paths:
+            return
+
+        def warm_adjacent() -> None:
+            for path in paths:
+                AudioFileManager.warm_file_cache(path)
+
+        QThreadPool.globalInstance().start(warm_adjacent)
+
+    @Slot(int)
     def _on_remove_track(self, index: int) -> None:
         """
         Handle remove track button click.
@@ -708,11 +986,16 @@ class AppController:
             return
 
         try:
+            # Drop a pending selection of this track
+            if self._pending_track is track:
+                self._pending_track = None
+
             # Stop playback if this track is currently selected
             if self._current_track_index == index:
                 self._audio_player.stop()
                 self._audio_player.unload()
                 self._current_track_index = -1
+                self._current_track = None
 
             # Remove track from show model
             self._current_show.remove_track(index)
@@ -732,9 +1015,11 @@ class AppController:
 
             # Delete audio file from storage
             # Note: We delete the file to save space, but this is irreversible
-            if track.audio_path.exists():
+            try:
                 track.audio_path.unlink()
                 logger.info(f"Deleted audio file: {track.audio_path}")
+            except FileNotFoundError:
+                logger.warning(f"Audio file already missing: {track.audio_path}")
 
             # Trigger auto-save
             self._trigger_auto_save()
@@ -751,18 +1036,9 @@ class AppController:
 
     # Playback Controls (4.3)
 
-    def _on_toggle_play_pause(self) -> None:
-        """Handle toggle play/pause (spacebar shortcut)."""
-        self._audio_player.toggle_play_pause()
-
-    def _on_play(self) -> None:
-        """Handle play button click."""
-        self._audio_player.play()
-
-    def _on_pause(self) -> None:
-        """Handle pause button click."""
-        self._audio_player.pause()
+    # Play, pause and toggle are connected directly to AudioPlayer
 
+    @Slot()
     def _on_skip_forward(self) -> None:
         """Handle skip forward button click."""
         if self._current_show is None:
@@ -771,6 +1047,7 @@ class AppController:
         skip_ms = self._current_show.settings.skip_increment_seconds * 1000
         self._audio_player.skip_forward(skip_ms)
 
+    @Slot()
     def _on_skip_backward(self) -> None:
         """Handle skip backward button click."""
         if self._current_show is None:
@@ -779,15 +1056,31 @@ class AppController:
         skip_ms = self._current_show.settings.skip_increment_seconds * 1000
         self._audio_player.skip_backward(skip_ms)
 
+    @Slot(int)
     def _on_position_changed(self, position_ms: int) -> None:
         """
         Handle position change from scrubbing.
 
+        Seeks are throttled to one per timer interval during a drag.
+
         Args:
             position_ms: New position in milliseconds
         """
+        self._pending_seek_ms = position_ms
+        if not self._seek_timer.isActive():
+            self._seek_timer.start()
+
+    @Slot()
+    def _flush_seek(self) -> None:
+        """Seek the audio player to the most recent scrub position."""
+        position_ms = self._pending_seek_ms
+        if position_ms is None:
+            return
+
+        self._pending_seek_ms = None
         self._audio_player.seek(position_ms)
 
+    @Slot(int)
     def _on_audio_position_changed(self, position_ms: int) -> None:
         """
         Handle position change from audio player.
@@ -795,12 +1088,21 @@ class AppController:
         Args:
             position_ms: Current position in milliseconds
         """
-        duration_ms = self._audio_player.get_duration_ms()
-        self._main_window.playback_controls.set_position(position_ms)
-        self._main_window.playback_controls.update_time_display(
-            position_ms, duration_ms
-        )
+        self._pending_position_ms = position_ms
+        if not self._position_update_timer.isActive():
+            self._position_update_timer.start()
+
+    @Slot()
+    def _flush_position_update(self) -> None:
+        """Apply the most recent audio position to the playback controls."""
+        position_ms = self._pending_position_ms
+        if position_ms is None:
+            return
+
+        self._pending_position_ms = None
+        self._main_window.playback_controls.tick(position_ms, self._duration_ms)
 
+    @Slot(int)
     def _on_audio_duration_changed(self, duration_ms: int) -> None:
         """
         Handle duration change from audio player.
@@ -808,8 +1110,10 @@ class AppController:
         Args:
             duration_ms: Track duration in milliseconds
         """
+        self._duration_ms = duration_ms
         self._main_window.playback_controls.set_duration(duration_ms)
 
+    @Slot(str)
     def _on_audio_error(self, error_msg: str) -> None:
         """
         Handle audio playback error.
@@ -825,9 +1129,11 @@ class AppController:
 
     # Marker Management (4.4, 4.6, 4.7)
 
+    @Slot()
     def _on_add_marker(self) -> None:
         """Handle add marker button click."""
-        if self._current_show is None or self._current_track_index < 0:
+        track = self._current_track
+        if track is None:
             show_warning(
                 self._main_window,
                 "No Track Selected",
@@ -835,19 +1141,15 @@ class AppController:
             )
             return
 
-        track = self._current_show.get_track(self._current_track_index)
-        if track is None:
-            return
-
         # Get current position
         position_ms = self._audio_player.get_position_ms()
 
-        # Get existing marker names for validation
-        existing_names = [m.name for m in track.markers]
-
-        # Show dialog with inline validation
-        dialog = AddMarkerDialog(position_ms, existing_names, self._main_window)
+        # Show dialog with inline validation against existing marker names
+        dialog = AddMarkerDialog(position_ms, track.marker_names, self._main_window)
         if dialog.exec():
+            if not self._is_still_current(track):
+                return
+
             marker_name = dialog.get_marker_name()
             timestamp_ms = dialog.get_timestamp_ms()
             self._add_marker_to_track(marker_name, timestamp_ms)
@@ -860,24 +1162,20 @@ class AppController:
             name: Marker name (already validated as unique by dialog)
             timestamp_ms: Timestamp in milliseconds
         """
-        if self._current_show is None or self._current_track_index < 0:
-            return
-
-        track = self._current_show.get_track(self._current_track_index)
+        track = self._current_track
         if track is None:
             return
 
         try:
             # Create and add marker (validation already done by dialog)
             marker = Marker(name=name, timestamp_ms=timestamp_ms)
-            track.add_marker(marker)
+            index = track.add_marker(marker)
 
-            # Update UI
-            self._main_window.marker_list.add_marker(name, timestamp_ms)
+            # Update UI, keeping list rows aligned with the sorted markers
+            self._main_window.marker_list.insert_marker(index, name, timestamp_ms)
 
             # Update marker visualization on progress bar
-            marker_positions = [m.timestamp_ms for m in track.markers]
-            self._main_window.playback_controls.set_markers(marker_positions)
+            self._main_window.playback_controls.set_markers_delta([timestamp_ms], [])
 
             # Trigger auto-save
             self._trigger_auto_save()
@@ -892,6 +1190,7 @@ class AppController:
                 f"Failed to add marker: {e}",
             )
 
+    @Slot(int)
     def _on_marker_selected(self, index: int) -> None:
         """
         Handle marker selection change.
@@ -901,6 +1200,7 @@ class AppController:
         """
         logger.debug(f"Marker selected: index {index}")
 
+    @Slot(int)
     def _on_marker_double_clicked(self, index: int) -> None:
         """
         Handle marker double-click (jump to marker).
@@ -908,10 +1208,7 @@ class AppController:
         Args:
             index: Index of marker
         """
-        if self._current_show is None or self._current_track_index < 0:
-            return
-
-        track = self._current_show.get_track(self._current_track_index)
+        track = self._current_track
         if track is None:
             return
 
@@ -920,6 +1217,7 @@ class AppController:
             logger.info(f"Jumping to marker: {marker.name} @ {marker.timestamp_ms}ms")
             self._audio_player.seek(marker.timestamp_ms)
 
+    @Slot(int)
     def _on_edit_marker(self, index: int) -> None:
         """
         Handle edit marker button click.
@@ -927,10 +1225,7 @@ class AppController:
         Args:
             index: Index of marker to edit
         """
-        if self._current_show is None or self._current_track_index < 0:
-            return
-
-        track = self._current_show.get_track(self._current_track_index)
+        track = self._current_track
         if track is None:
             return
 
@@ -940,20 +1235,27 @@ class AppController:
             # Show edit dialog
             dialog = EditMarkerDialog(marker.name, self._main_window)
             if dialog.exec():
+                if not self._is_still_current(track):
+                    return
+
+                # Rows may have moved while the dialog was open
+                index = self._find_marker_index(track, marker)
+                if index < 0:
+                    return
+
                 new_name = dialog.get_marker_name()
 
                 # Check for duplicate name (excluding current marker)
-                for i, m in enumerate(track.markers):
-                    if i != index and m.name == new_name:
-                        show_error(
-                            self._main_window,
-                            "Duplicate Marker",
-                            f'Marker "{new_name}" already exists in this track.',
-                        )
-                        return
+                if new_name != marker.name and track.has_marker(new_name):
+                    show_error(
+                        self._main_window,
+                        "Duplicate Marker",
+                        f'Marker "{new_name}" already exists in this track.',
+                    )
+                    return
 
                 # Update marker
-                marker.name = new_name
+                track.rename_marker(marker.name, new_name)
 
                 # Update UI
                 self._main_window.marker_list.update_marker(
@@ -961,10 +1263,11 @@ class AppController:
                 )
 
                 # Trigger auto-save
-                self._trigger_auto_save()
+                self._trigger_auto_save(self._marker_edit_debounce_ms)
 
                 logger.info(f"Marker renamed to: {new_name}")
 
+    @Slot(int)
     def _on_delete_marker(self, index: int) -> None:
         """
         Handle delete marker button click.
@@ -972,10 +1275,7 @@ class AppController:
         Args:
             index: Index of marker to delete
         """
-        if self._current_show is None or self._current_track_index < 0:
-            return
-
-        track = self._current_show.get_track(self._current_track_index)
+        track = self._current_track
         if track is None:
             return
 
@@ -988,25 +1288,71 @@ class AppController:
                 "Delete Marker",
                 f'Are you sure you want to delete marker "{marker.name}"?',
             ):
-                # Remove marker by name
-                track.remove_marker(marker.name)
+                if not self._is_still_current(track):
+                    return
+
+                # Rows may have moved while the dialog was open
+                index = self._find_marker_index(track, marker)
+                if index < 0:
+                    return
+
+                # Remove marker by position (list rows match track order)
+                track.remove_marker_at(index)
 
                 # Update UI
                 self._main_window.marker_list.remove_marker(index)
 
                 # Update marker visualization on progress bar
-                marker_positions = [m.timestamp_ms for m in track.markers]
-                self._main_window.playback_controls.set_markers(marker_positions)
+                self._main_window.playback_controls.set_markers_delta(
+                    [], [marker.timestamp_ms]
+                )
 
                 # Trigger auto-save
                 self._trigger_auto_save()
 
                 logger.info(f"Marker deleted: {marker.name}")
 
+    def _is_still_current(self, track: Track) -> bool:
+        """
+        Check that a track is still current after a modal dialog.
+
+        A dialog's event loop can deliver a pending track switch, after which
+        the marker list shows another track's markers.
+
+        Args:
+            track: The track that was current when the dialog opened
+
+        Returns:
+            True if the track is still current, False otherwise
+        """
+        if track is self._current_track:
+            return True
+        logger.info("Track changed while a dialog was open; ignoring edit")
+        return False
+
+    @staticmethod
+    def _find_marker_index(track: Track, marker: Marker) -> int:
+        """
+        Find a marker object in a track.
+
+        Args:
+            track: The track to search
+            marker: The marker to find (compared by identity)
+
+        Returns:
+            Index of the marker, or -1 if it is no longer in the track
+        """
+        for i, candidate in enumerate(track.markers):
+            if candidate is marker:
+                return i
+        return -1
+
+    @Slot()
     def _on_nudge_marker_backward(self) -> None:
         """Handle left arrow key press to nudge marker backward."""
         self._nudge_selected_marker(-1)
 
+    @Slot()
     def _on_nudge_marker_forward(self) -> None:
         """Handle right arrow key press to nudge marker forward."""
         self._nudge_selected_marker(1)
@@ -1018,11 +1364,8 @@ class AppController:
         Args:
             direction: 1 for forward (right arrow), -1 for backward (left arrow)
         """
-        if self._current_show is None or self._current_track_index < 0:
-            return
-
-        track = self._current_show.get_track(self._current_track_index)
-        if track is None:
+        track = self._current_track
+        if track is None or self._current_show is None:
             return
 
         # Get selected marker index from UI
@@ -1044,78 +1387,157 @@ class AppController:
 
         # Clamp to valid range (0 to track duration)
         new_timestamp = max(0, new_timestamp)
-        duration_ms = self._audio_player.get_duration_ms()
+        duration_ms = self._duration_ms  # Cached from duration_changed
         if duration_ms > 0:
             new_timestamp = min(new_timestamp, duration_ms)
 
-        # Update marker timestamp
-        marker.timestamp_ms = new_timestamp
+        # Update marker timestamp (may move the marker to keep timestamp order)
+        old_timestamp = marker.timestamp_ms
+        new_index = track.set_marker_timestamp(selected_index, new_timestamp)
 
-        # Update UI
-        self._main_window.marker_list.update_marker(
-            selected_index, marker.name, marker.timestamp_ms
-        )
+        # Update UI, moving the row if the marker passed a neighbour
+        marker_list = self._main_window.marker_list
+        if new_index != selected_index:
+            marker_list.move_marker(selected_index, new_index)
+        marker_list.update_marker(new_index, marker.name, marker.timestamp_ms)
 
         # Update marker visualization on progress bar
-        marker_positions = [m.timestamp_ms for m in track.markers]
-        self._main_window.playback_controls.set_markers(marker_positions)
+        self._main_window.playback_controls.set_markers_delta(
+            [marker.timestamp_ms], [old_timestamp]
+        )
 
         # Trigger auto-save
-        self._trigger_auto_save()
+        self._trigger_auto_save(self._marker_edit_debounce_ms)
 
+        # Fires on every arrow-key autorepeat; format lazily
         logger.debug(
-            f"Marker '{marker.name}' nudged {direction * nudge_increment_ms}ms "
-            f"to {marker.timestamp_ms}ms"
+            "Marker '%s' nudged %dms to %dms",
+            marker.name,
+            direction * nudge_increment_ms,
+            marker.timestamp_ms,
         )
 
     # Auto-Save
 
-    def _trigger_auto_save(self) -> None:
+    def _trigger_auto_save(self, debounce_ms: int | None = None) -> None:
         """
         Trigger a debounced auto-save.
 
         Called after any modification action. Uses a timer to debounce rapid changes,
         so multiple quick actions only result in one save operation.
+
+        Args:
+            debounce_ms: Delay before saving; defaults to the standard auto-save delay
         """
         if self._current_show is None:
             return
 
-        # Mark as modified
-        self._is_modified = True
-        self._update_window_title()
+        # Mark as modified; the title only changes on the first modification
+        self._change_generation += 1
+        if not self._is_modified:
+            self._is_modified = True
+            self._update_window_title()
 
         # Restart the debounce timer
         # If already running, this resets it (prevents saving during rapid edits)
-        self._auto_save_timer.start(self._auto_save_debounce_ms)
+        if debounce_ms is None:
+            debounce_ms = self._auto_save_debounce_ms
+        self._auto_save_timer.start(debounce_ms)
 
+    @Slot()
     def _on_auto_save(self) -> None:
         """Handle auto-save timer timeout (debounced save)."""
         # Only auto-save if there's a current show
         if self._current_show is None:
             return
 
-        try:
-            logger.debug("Auto-saving show...")
+        # One save at a time; rerun once the current one completes
+        if self._save_in_flight:
+            self._save_pending = True
+            return
 
-            # Save the show using proper method
-            self._show_repository.save(self._current_show)
+        logger.debug("Auto-saving show...")
+
+        # Snapshot on the GUI thread so the worker never reads live models
+        show = self._current_show
+        show_name = show.name
+        show_data = show.to_dict()
+        generation = self._change_generation
+        show_repository = self._show_repository
+
+        def write_show() -> None:
+            error = ""
+            try:
+                show_repository.save_data(show_name, show_data)
+            except Exception as e:
+                error = str(e) or repr(e)
+            try:
+                self._auto_save_finished.emit(show, generation, error)
+            except RuntimeError:
+                # Controller destroyed at shutdown; the write itself completed
+                pass
+
+        self._save_in_flight = True
+        self._save_pool.start(write_show)
+
+    @Slot(object, int, str)
+    def _on_auto_save_finished(self, show: Show, generation: int, error: str) -> None:
+        """
+        Handle completion of a background auto-save.
+
+        Args:
+            show: The show that was saved
+            generation: Change generation the saved snapshot was taken at
+            error: Error message, or an empty string on success
+        """
+        self._save_in_flight = False
 
-            # Update state
+        if error:
+            logger.error(f"Auto-save failed: {error}")
+            # Don't show error dialog during auto-save to avoid interrupting user
+            # Just log the error
+        elif show is self._current_show and generation == self._change_generation:
+            # Nothing was modified (or replaced) while the save was running
             self._is_modified = False
             self._update_window_title()
-
             logger.debug("Auto-save successful")
 
-            # Optional: Show brief status message in the UI
-            # (Could add a status bar message here in the future)
+        if self._save_pending:
+            self._save_pending = False
+            self._auto_save_timer.start(0)
+
+    @Slot()
+    def _flush_pending_save(self) -> None:
+        """
+        Save changes that have not reached disk yet, blocking until written.
+
+        Called when the application quits, so edits made within the
+        auto-save debounce window are not lost.
+        """
+        self._auto_save_timer.stop()
+        self._save_pending = False
+        self._save_pool.waitForDone()
 
+        if self._current_show is None or not self._is_modified:
+            return
+
+        # An in-flight save may already have written this state; the
+        # repository skips the write when the contents are unchanged
+        try:
+            self._show_repository.save(self._current_show)
+            self._is_modified = False
+            logger.info("Saved pending changes on exit")
         except Exception as e:
-            logger.error(f"Auto-save failed: {e}")
-            # Don't show error dialog during auto-save to avoid interrupting user
-            # Just log the error
+            logger.error(f"Failed to save pending changes on exit: {e}")
+            show_error(
+                self._main_window,
+                "Save Failed",
+                f"Failed to save show: {e}",
+            )
 
     # Settings and About
 
+    @Slot()
     def _on_settings(self) -> None:
         """Handle settings menu action."""
         if self._current_show is None:
@@ -1167,15 +1589,7 @@ class AppController:
                     "Settings have been updated successfully.",
                 )
 
+    @Slot()
     def _on_about(self) -> None:
         """Handle about menu action."""
-        import rehearsal_track_markers
-
-        show_info(
-            self._main_window,
-            "About Rehearsal Track Marker",
-            f"Rehearsal Track Marker v{rehearsal_track_markers.__version__}\n\n"
-            "A musical theatre rehearsal tool for adding timestamped markers "
-            "to audio tracks and quickly jumping to specific locations.\n\n"
-            "Built with PySide6 and Qt Multimedia.",
-        )
+        show_info(self._main_window, f"About {_BASE_TITLE}", _ABOUT_MESSAGE)
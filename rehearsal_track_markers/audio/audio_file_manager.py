@@ -1,7 +1,10 @@
 """Audio file management utilities."""
 
+import os
 import shutil
+import unicodedata
 from pathlib import Path
+from typing import BinaryIO
 
 from ..models import Track
 from ..persistence.file_manager import FileManager
@@ -18,18 +21,20 @@ class AudioFileManager:
     """
 
     # Supported audio formats (common formats supported by Qt Multimedia)
-    SUPPORTED_FORMATS = {
-        ".mp3",
-        ".wav",
-        ".m4a",
-        ".aac",
-        ".flac",
-        ".ogg",
-        ".opus",
-        ".wma",
-        ".aiff",
-        ".aif",
-    }
+    SUPPORTED_FORMATS = frozenset(
+        {
+            ".mp3",
+            ".wav",
+            ".m4a",
+            ".aac",
+            ".flac",
+            ".ogg",
+            ".opus",
+            ".wma",
+            ".aiff",
+            ".aif",
+        }
+    )
 
     def __init__(self, file_manager: FileManager | None = None):
         """
@@ -40,18 +45,21 @@ class AudioFileManager:
         """
         self.file_manager = file_manager or FileManager()
 
-    def is_supported_format(self, file_path: Path) -> bool:
+    def is_supported_format(self, file_path: Path | str) -> bool:
         """
         Check if a file format is supported.
 
         Args:
-            file_path: Path to the audio file
+            file_path: Path to the audio file (a plain string avoids building a Path)
 
         Returns:
             True if format is supported, False otherwise
         """
-        suffix = file_path.suffix.lower()
-        return suffix in self.SUPPORTED_FORMATS
+        if isinstance(file_path, str):
+            suffix = os.path.splitext(file_path)[1]
+        else:
+            suffix = file_path.suffix
+        return suffix.lower() in self.SUPPORTED_FORMATS
 
     def copy_audio_file(self, source_path: Path, show_name: str) -> Path:
         """
@@ -102,7 +110,7 @@ class AudioFileManager:
 
         # Copy file
         logger.info(f"Copying audio file: {source_path.name} -> {dest_path}")
-        shutil.copy2(source_path, dest_path)
+        self._copy_file(source_path, dest_path)
 
         # Verify copy
         if not dest_path.exists():
@@ -159,6 +167,94 @@ class AudioFileManager:
 
         return True
 
+    @staticmethod
+    def warm_file_cache(file_path: Path, max_bytes: int = 4 * 1024 * 1024) -> None:
+        """
+        Pull the start of an audio file into the OS page cache.
+
+        Opening a file in QMediaPlayer probes its headers and first frames;
+        when those bytes are already cached the probe avoids a disk or network
+        round trip. Blocking, so call it from a worker thread. Errors are
+        ignored since this is only a hint.
+
+        Args:
+            file_path: Path to the audio file
+            max_bytes: Number of leading bytes to prefetch
+        """
+        try:
+            with open(file_path, "rb") as f:
+                fadvise = getattr(os, "posix_fadvise", None)
+                if fadvise is not None:
+                    # Asynchronous readahead without copying into Python
+                    fadvise(f.fileno(), 0, max_bytes, os.POSIX_FADV_WILLNEED)
+                else:
+                    f.read(max_bytes)
+        except OSError as e:
+            logger.debug(f"Could not prefetch {file_path}: {e}")
+
+    @staticmethod
+    def _copy_file(source_path: Path, dest_path: Path) -> None:
+        """
+        Copy a file's contents and metadata to a new file.
+
+        On Linux the data is copied in-kernel with copy_file_range, which
+        reflinks on copy-on-write filesystems (Btrfs, XFS). Everywhere else,
+        or if the kernel refuses, this falls back to a buffered copy. The
+        destination is created exclusively, so an existing file is never
+        overwritten.
+
+        Args:
+            source_path: Path to the source file
+            dest_path: Path to the destination file
+
+        Raises:
+            FileExistsError: If the destination already exists
+            OSError: If file copy fails
+        """
+        with open(source_path, "rb") as src, open(dest_path, "xb") as dst:
+            try:
+                if not AudioFileManager._copy_file_range(src, dst):
+                    # Start over from the beginning in user space
+                    src.seek(0)
+                    dst.seek(0)
+                    dst.truncate()
+                    shutil.copyfileobj(src, dst, 1024 * 1024)
+            except OSError:
+                dst.close()
+                dest_path.unlink(missing_ok=True)
+                raise
+
+        shutil.copystat(source_path, dest_path)
+
+    @staticmethod
+    def _copy_file_range(src: BinaryIO, dst: BinaryIO) -> bool:
+        """
+        Copy an open file's contents in-kernel where supported.
+
+        Args:
+            src: Source file opened for binary reading
+            dst: Empty destination file opened for binary writing
+
+        Returns:
+            True if the whole file was copied, False if the caller must fall back
+        """
+        copy_file_range = getattr(os, "copy_file_range", None)
+        if copy_file_range is None:
+            return False
+
+        try:
+            remaining = os.fstat(src.fileno()).st_size
+            while remaining > 0:
+                copied = copy_file_range(src.fileno(), dst.fileno(), remaining)
+                if copied == 0:
+                    return False
+                remaining -= copied
+        except OSError as e:
+            # e.g. EXDEV across filesystems on older kernels, or ENOSYS
+            logger.debug(f"copy_file_range unavailable, falling back: {e}")
+            return False
+        return True
+
     @staticmethod
     def _files_are_identical(path1: Path, path2: Path) -> bool:
         """
@@ -175,8 +271,9 @@ class AudioFileManager:
         if path1.stat().st_size != path2.stat().st_size:
             return False
 
-        # Compare content (in chunks for memory efficiency)
-        chunk_size = 8192
+        # Compare content in large chunks: bytes equality is a C-level memcmp,
+        # so fewer, bigger reads keep the Python loop out of the hot path
+        chunk_size = 1024 * 1024
         with open(path1, "rb") as f1, open(path2, "rb") as f2:
             while True:
                 chunk1 = f1.read(chunk_size)
@@ -188,6 +285,19 @@ class AudioFileManager:
                 if not chunk1:  # End of file
                     return True
 
+    @staticmethod
+    def _filename_key(filename: str) -> str:
+        """
+        Normalize a filename for collision checks.
+
+        Args:
+            filename: File name to normalize
+
+        Returns:
+            The name in NFC form, casefolded
+        """
+        return unicodedata.normalize("NFC", filename).casefold()
+
     @staticmethod
     def _get_unique_filename(directory: Path, filename: str) -> Path:
         """
@@ -200,16 +310,22 @@ class AudioFileManager:
         Returns:
             Unique file path
         """
-        stem = Path(filename).stem
-        suffix = Path(filename).suffix
+        stem, suffix = os.path.splitext(filename)
+
+        # One directory read instead of a stat per candidate name. Names are
+        # compared as a case-insensitive filesystem (macOS, Windows) would,
+        # so a candidate never aliases an existing file there.
+        existing_names = {
+            AudioFileManager._filename_key(name)
+            for name in FileManager.snapshot_dir(directory)
+        }
 
         counter = 1
         while True:
             new_name = f"{stem}_{counter}{suffix}"
-            new_path = directory / new_name
 
-            if not new_path.exists():
-                return new_path
+            if AudioFileManager._filename_key(new_name) not in existing_names:
+                return directory / new_name
 
             counter += 1
 
@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from PySide6.QtCore import QObject, QUrl, Signal
+from PySide6.QtCore import QObject, QUrl, Signal, Slot
 from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
 
 from ..utils.logging_config import get_logger
@@ -17,6 +17,11 @@ class AudioPlayer(QObject):
     Provides low-latency playback control, seeking, and position tracking
     using Qt Multimedia (QMediaPlayer).
 
+    Threading: the player must be used from the thread that owns it (the GUI
+    thread). QMediaPlayer delivers its notifications on that same thread, so
+    signal handlers and control methods never run concurrently and no
+    locking is required.
+
     Signals:
         position_changed: Emitted when playback position changes (position_ms: int)
         duration_changed: Emitted when track duration is available (duration_ms: int)
@@ -83,6 +88,7 @@ class AudioPlayer(QObject):
             self.error_occurred.emit(f"Failed to load file: {e}")
             return False
 
+    @Slot()
     def play(self) -> None:
         """Start or resume playback."""
         if self._current_file is None:
@@ -92,6 +98,7 @@ class AudioPlayer(QObject):
         self._player.play()
         logger.debug("Playback started")
 
+    @Slot()
     def pause(self) -> None:
         """Pause playback."""
         if self._current_file is None:
@@ -109,6 +116,7 @@ class AudioPlayer(QObject):
         self._player.stop()
         logger.debug("Playback stopped")
 
+    @Slot()
     def toggle_play_pause(self) -> None:
         """Toggle between playing and paused states."""
         if self.is_playing():
@@ -116,6 +124,7 @@ class AudioPlayer(QObject):
         else:
             self.play()
 
+    @Slot(int)
     def seek(self, position_ms: int) -> None:
         """
         Seek to a specific position in the track.
@@ -140,7 +149,8 @@ class AudioPlayer(QObject):
 
         # Seek to position
         self._player.setPosition(position_ms)
-        logger.debug(f"Seeked to position: {position_ms}ms")
+        # Called continuously while scrubbing; format lazily
+        logger.debug("Seeked to position: %dms", position_ms)
 
     def skip_forward(self, increment_ms: int) -> None:
         """
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Marker:
     """
     A timestamped marker in an audio track.
@@ -49,7 +49,8 @@ class Marker:
             KeyError: If required keys are missing
             ValueError: If data is invalid
         """
-        return cls(name=data["name"], timestamp_ms=data["timestamp_ms"])
+        # Positional arguments: this runs once per marker on every show load
+        return cls(data["name"], data["timestamp_ms"])
 
     def __str__(self) -> str:
         """Return string representation of marker."""
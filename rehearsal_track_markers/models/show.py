@@ -7,7 +7,7 @@ from typing import Any
 from .track import Track
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """
     User-configurable settings for a show.
@@ -43,7 +43,7 @@ class Settings:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Show:
     """
     A show/production containing multiple audio tracks.
@@ -169,10 +169,11 @@ class Show:
         """
         settings = Settings.from_dict(data.get("settings", {}))
 
-        tracks = []
-        for track_data in data.get("tracks", []):
-            audio_path = audio_base_path / track_data["filename"]
-            tracks.append(Track.from_dict(track_data, audio_path))
+        track_from_dict = Track.from_dict
+        tracks = [
+            track_from_dict(track_data, audio_base_path / track_data["filename"])
+            for track_data in data.get("tracks", ())
+        ]
 
         return cls(name=data["show_name"], tracks=tracks, settings=settings)
 
@@ -1,13 +1,15 @@
 """Track model for audio files with markers."""
 
+import bisect
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
 from .marker import Marker
 
 
-@dataclass
+@dataclass(slots=True)
 class Track:
     """
     An audio track with associated markers.
@@ -23,6 +25,14 @@ class Track:
     audio_path: Path
     markers: list[Marker] = field(default_factory=list)
     duration_ms: int | None = None
+    # Marker timestamps, index-aligned with ``markers``
+    _marker_timestamps: list[int] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # Names of all markers, for constant-time duplicate checks
+    _marker_names: set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate track data after initialization."""
@@ -33,22 +43,68 @@ class Track:
         if isinstance(self.audio_path, str):
             self.audio_path = Path(self.audio_path)
 
-    def add_marker(self, marker: Marker) -> None:
+        # Keep markers sorted by timestamp, without reordering the caller's list
+        self.markers = sorted(self.markers, key=attrgetter("timestamp_ms"))
+        self._marker_timestamps = [m.timestamp_ms for m in self.markers]
+        self._marker_names = {m.name for m in self.markers}
+
+        # Name-based lookups and removals rely on names being unique
+        if len(self._marker_names) != len(self.markers):
+            seen: set[str] = set()
+            for marker in self.markers:
+                if marker.name in seen:
+                    raise ValueError(
+                        f"Marker with name '{marker.name}' appears more than once"
+                    )
+                seen.add(marker.name)
+
+    @property
+    def marker_positions(self) -> list[int]:
+        """
+        Marker timestamps in the same order as ``markers``.
+
+        The list is maintained incrementally and must not be mutated by callers.
+
+        Returns:
+            List of marker timestamps in milliseconds
+        """
+        return self._marker_timestamps
+
+    @property
+    def marker_names(self) -> set[str]:
+        """
+        Names of all markers on this track.
+
+        The set is maintained incrementally and must not be mutated by callers.
+        Rename markers with ``rename_marker`` so the set stays in sync.
+
+        Returns:
+            Set of marker names
+        """
+        return self._marker_names
+
+    def add_marker(self, marker: Marker) -> int:
         """
         Add a marker to this track.
 
         Args:
             marker: The marker to add
 
+        Returns:
+            Index at which the marker was inserted
+
         Raises:
             ValueError: If a marker with the same name already exists
         """
         if self.has_marker(marker.name):
             raise ValueError(f"Marker with name '{marker.name}' already exists")
 
-        self.markers.append(marker)
-        # Keep markers sorted by timestamp
-        self.markers.sort(key=lambda m: m.timestamp_ms)
+        # Keep markers sorted by timestamp (after any equal timestamps)
+        index = bisect.bisect_right(self._marker_timestamps, marker.timestamp_ms)
+        self.markers.insert(index, marker)
+        self._marker_timestamps.insert(index, marker.timestamp_ms)
+        self._marker_names.add(marker.name)
+        return index
 
     def remove_marker(self, name: str) -> bool:
         """
@@ -60,12 +116,64 @@ class Track:
         Returns:
             True if marker was removed, False if not found
         """
+        if name not in self._marker_names:
+            return False
+
         for i, marker in enumerate(self.markers):
             if marker.name == name:
-                del self.markers[i]
+                self.remove_marker_at(i)
                 return True
         return False
 
+    def remove_marker_at(self, index: int) -> Marker | None:
+        """
+        Remove the marker at the given index.
+
+        Args:
+            index: Index of the marker to remove
+
+        Returns:
+            The removed marker, or None if index invalid
+        """
+        if not 0 <= index < len(self.markers):
+            return None
+
+        marker = self.markers.pop(index)
+        del self._marker_timestamps[index]
+        self._marker_names.discard(marker.name)
+        return marker
+
+    def set_marker_timestamp(self, index: int, timestamp_ms: int) -> int:
+        """
+        Change the timestamp of the marker at the given index.
+
+        The marker is moved as needed to keep markers sorted by timestamp.
+
+        Args:
+            index: Index of the marker to update
+            timestamp_ms: New timestamp in milliseconds
+
+        Returns:
+            New index of the marker, or -1 if index invalid
+
+        Raises:
+            ValueError: If timestamp is negative
+        """
+        if timestamp_ms < 0:
+            raise ValueError("Marker timestamp cannot be negative")
+
+        if not 0 <= index < len(self.markers):
+            return -1
+
+        marker = self.markers.pop(index)
+        del self._marker_timestamps[index]
+
+        marker.timestamp_ms = timestamp_ms
+        new_index = bisect.bisect_right(self._marker_timestamps, timestamp_ms)
+        self.markers.insert(new_index, marker)
+        self._marker_timestamps.insert(new_index, timestamp_ms)
+        return new_index
+
     def get_marker(self, name: str) -> Marker | None:
         """
         Get a marker by name.
@@ -76,6 +184,9 @@ class Track:
         Returns:
             The marker if found, None otherwise
         """
+        # Misses are answered from the name set without walking the list
+        if name not in self._marker_names:
+            return None
         for marker in self.markers:
             if marker.name == name:
                 return marker
@@ -91,7 +202,7 @@ class Track:
         Returns:
             True if marker exists, False otherwise
         """
-        return any(marker.name == name for marker in self.markers)
+        return name in self._marker_names
 
     def rename_marker(self, old_name: str, new_name: str) -> bool:
         """
@@ -115,6 +226,8 @@ class Track:
 
         marker = self.get_marker(old_name)
         if marker:
+            self._marker_names.discard(old_name)
+            self._marker_names.add(new_name)
             marker.name = new_name
             return True
         return False
@@ -152,7 +265,8 @@ class Track:
             KeyError: If required keys are missing
             ValueError: If data is invalid
         """
-        markers = [Marker.from_dict(m) for m in data.get("markers", [])]
+        marker_from_dict = Marker.from_dict
+        markers = [marker_from_dict(m) for m in data.get("markers", [])]
 
         return cls(
             filename=data["filename"],
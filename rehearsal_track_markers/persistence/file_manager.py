@@ -1,6 +1,9 @@
 """File system utilities for managing app directories and files."""
 
+import functools
+import os
 import platform
+import shutil
 from pathlib import Path
 
 from ..utils.logging_config import get_logger
@@ -30,13 +33,21 @@ class FileManager:
         else:
             self.base_path = self._get_default_base_path()
 
+        # Resolved (show_dir, audio_dir, json_file) keyed by (base_path, show_name)
+        self._show_paths_cache: dict[tuple[Path, str], tuple[Path, Path, Path]] = {}
+        # Show directories this instance has already created
+        self._created_show_dirs: set[tuple[Path, str]] = set()
+
         logger.info(f"FileManager initialized with base path: {self.base_path}")
 
     @staticmethod
+    @functools.cache
     def _get_default_base_path() -> Path:
         """
         Get the default base path for app data based on platform.
 
+        Resolved once per process, since every default FileManager needs it.
+
         Returns:
             Platform-specific base path for application data
         """
@@ -73,7 +84,7 @@ class FileManager:
         Returns:
             Path to the show's directory
         """
-        return self.get_shows_directory() / show_name
+        return self._show_paths(show_name)[0]
 
     def get_show_audio_directory(self, show_name: str) -> Path:
         """
@@ -85,7 +96,7 @@ class FileManager:
         Returns:
             Path to the show's audio directory
         """
-        return self.get_show_directory(show_name) / "audio"
+        return self._show_paths(show_name)[1]
 
     def get_show_file_path(self, show_name: str) -> Path:
         """
@@ -97,18 +108,46 @@ class FileManager:
         Returns:
             Path to the show's JSON file
         """
-        return self.get_show_directory(show_name) / f"{show_name}.json"
+        return self._show_paths(show_name)[2]
+
+    def _show_paths(self, show_name: str) -> tuple[Path, Path, Path]:
+        """
+        Resolve all paths belonging to a show, memoized per show.
+
+        Looked up several times on every save/load; the key includes
+        base_path so the cache stays correct if base_path is reassigned.
+
+        Args:
+            show_name: Name of the show
+
+        Returns:
+            Tuple of (show directory, audio directory, JSON file path)
+        """
+        key = (self.base_path, show_name)
+        paths = self._show_paths_cache.get(key)
+        if paths is None:
+            show_dir = self.get_shows_directory() / show_name
+            paths = (show_dir, show_dir / "audio", show_dir / f"{show_name}.json")
+            self._show_paths_cache[key] = paths
+        return paths
 
     def create_show_directories(self, show_name: str) -> None:
         """
         Create the directory structure for a new show.
 
+        Called before every save, so directories created earlier by this
+        instance are not created again.
+
         Args:
             show_name: Name of the show
 
         Raises:
             OSError: If directory creation fails
         """
+        key = (self.base_path, show_name)
+        if key in self._created_show_dirs:
+            return
+
         show_dir = self.get_show_directory(show_name)
         audio_dir = self.get_show_audio_directory(show_name)
 
@@ -119,6 +158,7 @@ class FileManager:
 
         logger.info(f"Created show directory: {show_dir}")
         logger.info(f"Created audio directory: {audio_dir}")
+        self._created_show_dirs.add(key)
 
     def show_exists(self, show_name: str) -> bool:
         """
@@ -133,6 +173,26 @@ class FileManager:
         show_file = self.get_show_file_path(show_name)
         return show_file.exists()
 
+    @staticmethod
+    def snapshot_dir(directory: Path) -> set[str]:
+        """
+        List the entry names in a directory with a single directory read.
+
+        Membership checks against the result replace one stat call per file,
+        which matters on network mounts.
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Names of the directory's entries, or an empty set if it is missing
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            return set()
+
     def list_shows(self) -> list[str]:
         """
         List all shows in the shows directory.
@@ -140,18 +200,19 @@ class FileManager:
         Returns:
             List of show names
         """
-        shows_dir = self.get_shows_directory()
-
-        if not shows_dir.exists():
-            return []
-
         show_names = []
-        for item in shows_dir.iterdir():
-            if item.is_dir():
-                # Check if the directory has a corresponding JSON file
-                json_file = item / f"{item.name}.json"
-                if json_file.exists():
-                    show_names.append(item.name)
+        try:
+            # scandir answers is_dir from the directory read on most platforms,
+            # leaving one stat per show for the JSON file check
+            with os.scandir(self.get_shows_directory()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Check if the directory has a corresponding JSON file
+                        json_file = os.path.join(entry.path, f"{entry.name}.json")
+                        if os.path.exists(json_file):
+                            show_names.append(entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            return []
 
         return sorted(show_names)
 
@@ -174,10 +235,10 @@ class FileManager:
             logger.warning(f"Cannot delete show '{show_name}': not found")
             return False
 
-        import shutil
-
         logger.info(f"Deleting show: {show_name}")
         shutil.rmtree(show_dir)
+        self._created_show_dirs.discard((self.base_path, show_name))
+        self._show_paths_cache.pop((self.base_path, show_name), None)
         logger.info(f"Deleted show directory: {show_dir}")
 
         return True
@@ -1,10 +1,13 @@
 """Repository for loading and saving show data."""
 
-import json
+import hashlib
+import os
 from pathlib import Path
+from typing import Any
 
 from .file_manager import FileManager
 from ..models import Show
+from ..utils import fastjson
 from ..utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -25,11 +28,17 @@ class ShowRepository:
             file_manager: Optional FileManager instance. If None, creates a new one.
         """
         self.file_manager = file_manager or FileManager()
+        # Digest of the last payload written per show file, used to skip
+        # no-op saves without keeping whole documents in memory
+        self._last_saved: dict[Path, bytes] = {}
 
     def save(self, show: Show) -> None:
         """
         Save a show to disk.
 
+        The file is replaced atomically, and the write is skipped entirely
+        when the serialized show is identical to what was last saved.
+
         Args:
             show: The show to save
 
@@ -39,21 +48,76 @@ class ShowRepository:
         """
         logger.info(f"Saving show: {show.name}")
 
+        # Convert show to dictionary
+        self.save_data(show.name, show.to_dict())
+
+    def save_data(self, show_name: str, show_data: dict[str, Any]) -> None:
+        """
+        Save a show that has already been converted with ``Show.to_dict()``.
+
+        This does no work on the Show itself, so it can run on a worker
+        thread while the GUI keeps editing the live model. Calls must not
+        overlap with each other.
+
+        Args:
+            show_name: Name of the show
+            show_data: Dictionary representation of the show
+
+        Raises:
+            OSError: If file operations fail
+        """
         # Ensure show directories exist
-        self.file_manager.create_show_directories(show.name)
+        self.file_manager.create_show_directories(show_name)
 
         # Get the path to the show's JSON file
-        show_file_path = self.file_manager.get_show_file_path(show.name)
+        show_file_path = self.file_manager.get_show_file_path(show_name)
 
-        # Convert show to dictionary
-        show_data = show.to_dict()
+        payload = fastjson.dumps(show_data)
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+
+        # Nothing changed since the last save (e.g. a nudge that was undone)
+        if self._last_saved.get(show_file_path) == digest and show_file_path.exists():
+            logger.debug(f"Show unchanged, skipping write: {show_file_path}")
+            return
 
         # Write JSON file
-        with open(show_file_path, "w", encoding="utf-8") as f:
-            json.dump(show_data, f, indent=2, ensure_ascii=False)
+        try:
+            self._write_atomic(show_file_path, payload)
+        except FileNotFoundError:
+            # Show directory was removed outside the app since it was created
+            show_file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(show_file_path, payload)
+        self._last_saved[show_file_path] = digest
 
         logger.info(f"Saved show to: {show_file_path}")
 
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """
+        Write a file by replacing it atomically.
+
+        The data goes to a temporary file in the same directory, is flushed to
+        disk, and is then renamed over the target, so neither a crash nor a
+        power loss mid-write leaves a truncated show file behind.
+
+        Args:
+            path: Destination file path
+            data: File contents
+
+        Raises:
+            OSError: If file operations fail
+        """
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
     def load(self, show_name: str) -> Show:
         """
         Load a show from disk.
@@ -66,7 +130,7 @@ class ShowRepository:
 
         Raises:
             FileNotFoundError: If show file doesn't exist
-            json.JSONDecodeError: If JSON is malformed
+            fastjson.JSONDecodeError: If JSON is malformed
             KeyError: If required JSON fields are missing
             ValueError: If show data is invalid
         """
@@ -78,8 +142,7 @@ class ShowRepository:
             raise FileNotFoundError(f"Show file not found: {show_file_path}")
 
         # Read JSON file
-        with open(show_file_path, "r", encoding="utf-8") as f:
-            show_data = json.load(f)
+        show_data = fastjson.loads(show_file_path.read_bytes())
 
         # Get the audio directory for this show
         audio_dir = self.file_manager.get_show_audio_directory(show_name)
@@ -150,8 +213,7 @@ class ShowRepository:
         show_data = show.to_dict()
 
         # Write JSON file
-        with open(export_path, "w", encoding="utf-8") as f:
-            json.dump(show_data, f, indent=2, ensure_ascii=False)
+        export_path.write_bytes(fastjson.dumps(show_data))
 
         logger.info(f"Exported show to: {export_path}")
 
@@ -171,7 +233,7 @@ class ShowRepository:
 
         Raises:
             FileNotFoundError: If import file doesn't exist
-            json.JSONDecodeError: If JSON is malformed
+            fastjson.JSONDecodeError: If JSON is malformed
             KeyError: If required JSON fields are missing
             ValueError: If show data is invalid
         """
@@ -181,8 +243,7 @@ class ShowRepository:
             raise FileNotFoundError(f"Import file not found: {import_path}")
 
         # Read JSON file
-        with open(import_path, "r", encoding="utf-8") as f:
-            show_data = json.load(f)
+        show_data = fastjson.loads(import_path.read_bytes())
 
         # Determine audio source directory
         if audio_source_dir is None:
@@ -1,5 +1,8 @@
 """Dialog widgets for user interactions."""
 
+from collections.abc import Iterable
+
+from PySide6.QtCore import Slot
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -16,6 +19,10 @@ from ..utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Standard button sets, combined once rather than in every dialog
+_OK_CANCEL = QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+_YES_NO = QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+
 
 class NewShowDialog(QDialog):
     """
@@ -54,9 +61,7 @@ class NewShowDialog(QDialog):
         layout.addLayout(form_layout)
 
         # Buttons
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
+        buttons = QDialogButtonBox(_OK_CANCEL)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
@@ -73,6 +78,7 @@ class NewShowDialog(QDialog):
         """
         return self._name_input.text().strip()
 
+    @Slot()
     def accept(self) -> None:
         """Accept the dialog if validation passes."""
         if not self.get_show_name():
@@ -95,14 +101,14 @@ class AddMarkerDialog(QDialog):
     """
 
     def __init__(
-        self, timestamp_ms: int, existing_names: list[str], parent=None
+        self, timestamp_ms: int, existing_names: Iterable[str], parent=None
     ) -> None:
         """
         Initialize the add marker dialog.
 
         Args:
             timestamp_ms: Timestamp for the marker in milliseconds
-            existing_names: List of existing marker names (for duplicate checking)
+            existing_names: Existing marker names (for duplicate checking)
             parent: Optional parent widget
         """
         super().__init__(parent)
@@ -112,7 +118,8 @@ class AddMarkerDialog(QDialog):
         self.setMinimumWidth(400)
 
         self._timestamp_ms = timestamp_ms
-        self._existing_names = [name.lower() for name in existing_names]
+        # Lowercased once so each validation is a constant-time lookup
+        self._existing_names = frozenset(name.lower() for name in existing_names)
 
         self._setup_ui()
 
@@ -125,8 +132,7 @@ class AddMarkerDialog(QDialog):
 
         # Timestamp display (read-only)
         time_str = self._format_timestamp(self._timestamp_ms)
-        timestamp_label = QLineEdit(time_str)
-        timestamp_label.setReadOnly(True)
+        timestamp_label = QLabel(time_str)
         timestamp_label.setStyleSheet("color: gray;")
         form_layout.addRow("Position:", timestamp_label)
 
@@ -139,18 +145,14 @@ class AddMarkerDialog(QDialog):
         layout.addLayout(form_layout)
 
         # Error message label (initially hidden)
-        self._error_label = QLineEdit()
-        self._error_label.setReadOnly(True)
-        self._error_label.setStyleSheet(
-            "color: red; background: transparent; border: none;"
-        )
+        self._error_label = QLabel()
+        self._error_label.setStyleSheet("color: red;")
+        self._error_label.setWordWrap(True)
         self._error_label.setVisible(False)
         layout.addWidget(self._error_label)
 
         # Buttons
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
+        buttons = QDialogButtonBox(_OK_CANCEL)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
@@ -168,14 +170,16 @@ class AddMarkerDialog(QDialog):
         Returns:
             Formatted time string
         """
-        total_seconds = milliseconds / 1000
-        minutes = int(total_seconds // 60)
-        seconds = total_seconds % 60
-        return f"{minutes}:{seconds:06.3f}"
+        minutes, remainder = divmod(milliseconds, 60000)
+        seconds, millis = divmod(remainder, 1000)
+        return f"{minutes}:{seconds:02d}.{millis:03d}"
 
+    @Slot()
     def _on_text_changed(self) -> None:
         """Handle text changes to clear error message."""
-        self._error_label.setVisible(False)
+        # Runs on every keystroke; the label is usually already hidden
+        if not self._error_label.isHidden():
+            self._error_label.setVisible(False)
 
     def get_marker_name(self) -> str:
         """
@@ -205,6 +209,7 @@ class AddMarkerDialog(QDialog):
         self._error_label.setText(message)
         self._error_label.setVisible(True)
 
+    @Slot()
     def accept(self) -> None:
         """Accept the dialog if validation passes."""
         name = self.get_marker_name()
@@ -269,9 +274,7 @@ class EditMarkerDialog(QDialog):
         layout.addLayout(form_layout)
 
         # Buttons
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
+        buttons = QDialogButtonBox(_OK_CANCEL)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
@@ -288,6 +291,7 @@ class EditMarkerDialog(QDialog):
         """
         return self._name_input.text().strip()
 
+    @Slot()
     def accept(self) -> None:
         """Accept the dialog if validation passes."""
         if not self.get_marker_name():
@@ -382,9 +386,7 @@ class SettingsDialog(QDialog):
         layout.addWidget(hint)
 
         # Buttons
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
-        )
+        buttons = QDialogButtonBox(_OK_CANCEL)
         buttons.accepted.connect(self.accept)
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
@@ -466,7 +468,7 @@ def confirm(parent, title: str, message: str) -> bool:
         parent,
         title,
         message,
-        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        _YES_NO,
         QMessageBox.StandardButton.No,
     )
     return result == QMessageBox.StandardButton.Yes
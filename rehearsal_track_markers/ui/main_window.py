@@ -265,6 +265,30 @@ class MainWindow(QMainWindow):
         self._stacked_widget.setCurrentIndex(1)
         logger.debug("Showing main UI")
 
+    def set_busy(self, message: str | None) -> None:
+        """
+        Show or clear a background operation in progress.
+
+        While busy, the status bar shows the message, and actions that would
+        replace the current show or add more tracks are disabled.
+
+        Args:
+            message: Status text to show, or None when the operation is done
+        """
+        busy = message is not None
+        for action in (
+            self._new_show_action,
+            self._open_show_action,
+            self._import_show_action,
+        ):
+            action.setEnabled(not busy)
+        self._track_sidebar.set_add_track_enabled(not busy)
+
+        if message is not None:
+            self.statusBar().showMessage(message)
+        else:
+            self.statusBar().clearMessage()
+
     # Menu action accessors
 
     @property
@@ -1,5 +1,7 @@
 """Marker list widget for displaying and managing markers."""
 
+from collections.abc import Iterable
+
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -141,6 +143,20 @@ class MarkerList(QWidget):
         self._marker_list.addItem(item)
         logger.debug(f"Added marker to list: {marker_name} ({timestamp_ms}ms)")
 
+    def insert_marker(self, index: int, marker_name: str, timestamp_ms: int) -> None:
+        """
+        Insert a marker into the list at a given position.
+
+        Args:
+            index: Position to insert at (appends if past the end)
+            marker_name: Name of the marker
+            timestamp_ms: Timestamp in milliseconds
+        """
+        item = QListWidgetItem(marker_name)
+        item.setData(Qt.ItemDataRole.UserRole, timestamp_ms)
+        self._marker_list.insertItem(index, item)
+        logger.debug(f"Inserted marker at {index}: {marker_name} ({timestamp_ms}ms)")
+
     def remove_marker(self, index: int) -> bool:
         """
         Remove a marker from the list.
@@ -205,24 +221,71 @@ class MarkerList(QWidget):
         if 0 <= index < self._marker_list.count():
             item = self._marker_list.item(index)
             if item:
-                item.setText(marker_name)
-                item.setData(Qt.ItemDataRole.UserRole, timestamp_ms)
+                # Only touch changed roles: a nudge changes just the timestamp,
+                # and leaving the text alone avoids a relayout of the row
+                if item.text() != marker_name:
+                    item.setText(marker_name)
+                if item.data(Qt.ItemDataRole.UserRole) != timestamp_ms:
+                    item.setData(Qt.ItemDataRole.UserRole, timestamp_ms)
                 logger.debug(f"Updated marker: {marker_name} ({timestamp_ms}ms)")
                 return True
         return False
 
+    def move_marker(self, from_index: int, to_index: int) -> bool:
+        """
+        Move a marker to another row and select it there.
+
+        Args:
+            from_index: Current index of the marker
+            to_index: Index the marker should end up at
+
+        Returns:
+            True if marker was moved, False if an index is invalid
+        """
+        count = self._marker_list.count()
+        if not (0 <= from_index < count and 0 <= to_index < count):
+            return False
+
+        # Suspend selection signals while the row is detached
+        self._marker_list.blockSignals(True)
+        try:
+            item = self._marker_list.takeItem(from_index)
+            self._marker_list.insertItem(to_index, item)
+        finally:
+            self._marker_list.blockSignals(False)
+
+        self._marker_list.setCurrentRow(to_index)
+        logger.debug(f"Moved marker from {from_index} to {to_index}")
+        return True
+
     def set_markers(
-        self, markers: list[tuple[str, int]]
-    ) -> None:  # List of (name, timestamp_ms)
+        self, markers: Iterable[tuple[str, int]]
+    ) -> None:  # (name, timestamp_ms) pairs
         """
         Set the entire marker list.
 
+        The list is repopulated in a single batch with repaints and
+        selection signals suspended until all items are inserted.
+
         Args:
-            markers: List of tuples (marker_name, timestamp_ms)
+            markers: Tuples of (marker_name, timestamp_ms)
         """
-        self.clear_markers()
-        for name, timestamp_ms in markers:
-            self.add_marker(name, timestamp_ms)
+        self._marker_list.setUpdatesEnabled(False)
+        self._marker_list.blockSignals(True)
+        try:
+            self._marker_list.clear()
+            for name, timestamp_ms in markers:
+                item = QListWidgetItem(name)
+                item.setData(Qt.ItemDataRole.UserRole, timestamp_ms)
+                self._marker_list.addItem(item)
+        finally:
+            self._marker_list.blockSignals(False)
+            self._marker_list.setUpdatesEnabled(True)
+
+        has_selection = self._marker_list.currentRow() >= 0
+        self._edit_button.setEnabled(has_selection)
+        self._delete_button.setEnabled(has_selection)
+        logger.debug(f"Set {self._marker_list.count()} markers in list")
 
     def _on_add_marker_clicked(self) -> None:
         """Handle Add Marker button click."""
@@ -1,5 +1,7 @@
 """Custom progress bar with marker visualization."""
 
+import bisect
+
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QPainter, QPen
 from PySide6.QtWidgets import QSlider, QStyleOptionSlider
@@ -31,15 +33,40 @@ class MarkerProgressBar(QSlider):
         """
         Set the marker positions to display.
 
+        The positions are copied into the bar's own list, which is reused
+        across calls rather than reallocated.
+
         Args:
             marker_positions: List of marker timestamps in milliseconds
         """
-        self._marker_positions = sorted(marker_positions)
+        self._marker_positions[:] = marker_positions
+        self._marker_positions.sort()  # Linear when already sorted
         self.update()  # Trigger repaint
 
+    def set_markers_delta(self, added: list[int], removed: list[int]) -> None:
+        """
+        Apply an incremental change to the displayed marker positions.
+
+        Args:
+            added: Marker timestamps in milliseconds to add
+            removed: Marker timestamps in milliseconds to remove
+        """
+        for marker_pos in removed:
+            i = bisect.bisect_left(self._marker_positions, marker_pos)
+            if (
+                i < len(self._marker_positions)
+                and self._marker_positions[i] == marker_pos
+            ):
+                del self._marker_positions[i]
+
+        for marker_pos in added:
+            bisect.insort(self._marker_positions, marker_pos)
+
+        self.update()
+
     def clear_markers(self) -> None:
         """Clear all marker positions."""
-        self._marker_positions = []
+        self._marker_positions.clear()
         self.update()
 
     def paintEvent(self, event) -> None:  # type: ignore
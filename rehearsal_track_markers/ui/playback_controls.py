@@ -98,7 +98,8 @@ class PlaybackControls(QWidget):
         layout.addWidget(self._progress_slider)
 
         # Time display
-        self._time_label = QLabel("0:00 / 0:00")
+        self._time_text = "0:00 / 0:00"
+        self._time_label = QLabel(self._time_text)
         self._time_label.setStyleSheet("color: gray;")
         layout.addWidget(self._time_label)
 
@@ -158,6 +159,21 @@ class PlaybackControls(QWidget):
         """
         self._update_time_display(current_ms, total_ms)
 
+    def tick(self, position_ms: int, duration_ms: int) -> None:
+        """
+        Move the progress bar and time display to a playback position.
+
+        Called for every position update during playback, so the slider and
+        label are updated together and the label is only touched when the
+        displayed text changes.
+
+        Args:
+            position_ms: Current position in milliseconds
+            duration_ms: Total duration in milliseconds
+        """
+        self.set_position(position_ms)
+        self._update_time_display(position_ms, duration_ms)
+
     def set_skip_increment(self, seconds: int) -> None:
         """
         Set the skip increment display on buttons.
@@ -177,6 +193,16 @@ class PlaybackControls(QWidget):
         """
         self._progress_slider.set_markers(marker_positions)
 
+    def set_markers_delta(self, added: list[int], removed: list[int]) -> None:
+        """
+        Add and remove individual marker positions on the progress bar.
+
+        Args:
+            added: Marker timestamps in milliseconds to add
+            removed: Marker timestamps in milliseconds to remove
+        """
+        self._progress_slider.set_markers_delta(added, removed)
+
     def clear_markers(self) -> None:
         """Clear all markers from the progress bar."""
         self._progress_slider.clear_markers()
@@ -191,7 +217,13 @@ class PlaybackControls(QWidget):
         """
         current_str = self._format_time(current_ms)
         total_str = self._format_time(total_ms)
-        self._time_label.setText(f"{current_str} / {total_str}")
+        text = f"{current_str} / {total_str}"
+
+        # The text only changes once a second while position updates arrive
+        # many times a second
+        if text != self._time_text:
+            self._time_text = text
+            self._time_label.setText(text)
 
     @staticmethod
     def _format_time(milliseconds: int) -> str:
@@ -236,7 +268,8 @@ class PlaybackControls(QWidget):
         Args:
             value: New slider value (0-duration_ms)
         """
-        logger.debug(f"Slider moved to: {value}ms")
+        # Fires on every mouse move while scrubbing; format lazily
+        logger.debug("Slider moved to: %dms", value)
         self.position_changed.emit(value)
 
     def _on_slider_pressed(self) -> None:
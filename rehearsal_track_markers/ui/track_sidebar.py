@@ -1,5 +1,7 @@
 """Track sidebar widget for displaying and selecting tracks."""
 
+from collections.abc import Iterable
+
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -107,6 +109,20 @@ class TrackSidebar(QWidget):
         self._track_list.addItem(item)
         logger.debug(f"Added track to sidebar: {track_name}")
 
+    def add_tracks(self, track_names: Iterable[str]) -> None:
+        """
+        Append several tracks to the list in a single batch.
+
+        Args:
+            track_names: Names of the tracks to add
+        """
+        self._track_list.setUpdatesEnabled(False)
+        try:
+            self._track_list.addItems(list(track_names))
+        finally:
+            self._track_list.setUpdatesEnabled(True)
+        logger.debug(f"Added tracks to sidebar, now {self._track_list.count()}")
+
     def remove_track(self, index: int) -> bool:
         """
         Remove a track from the list.
@@ -156,21 +172,41 @@ class TrackSidebar(QWidget):
         """
         return self._track_list.currentRow()
 
-    def set_tracks(self, track_names: list[str]) -> None:
+    def set_tracks(self, track_names: Iterable[str]) -> None:
         """
         Set the entire track list.
 
+        The list is repopulated in a single batch with repaints and
+        selection signals suspended until all items are inserted.
+
         Args:
-            track_names: List of track names to display
+            track_names: Track names to display
         """
-        self.clear_tracks()
-        for name in track_names:
-            self.add_track(name)
+        self._track_list.setUpdatesEnabled(False)
+        self._track_list.blockSignals(True)
+        try:
+            self._track_list.clear()
+            self._track_list.addItems(list(track_names))
+        finally:
+            self._track_list.blockSignals(False)
+            self._track_list.setUpdatesEnabled(True)
+
+        self._remove_track_button.setEnabled(self._track_list.currentRow() >= 0)
+        logger.debug(f"Set {self._track_list.count()} tracks in sidebar")
 
         # Select first track if available
-        if track_names:
+        if self._track_list.count():
             self.set_selected_track(0)
 
+    def set_add_track_enabled(self, enabled: bool) -> None:
+        """
+        Enable or disable the "Add Track" button.
+
+        Args:
+            enabled: Whether tracks can currently be added
+        """
+        self._add_track_button.setEnabled(enabled)
+
     def _on_selection_changed(self, current_row: int) -> None:
         """
         Handle track selection changes.
@@ -0,0 +1,50 @@
+"""JSON encoding/decoding with an optional fast backend.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Both backends produce the same UTF-8, 2-space indented output.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this alias regardless of the active backend.
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to indented UTF-8 JSON.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: UTF-8 encoded JSON bytes or a JSON string
+
+    Returns:
+        The decoded object
+
+    Raises:
+        JSONDecodeError: If the document is malformed
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
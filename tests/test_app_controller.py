@@ -0,0 +1,221 @@
+"""Unit tests for the application controller."""
+
+from pathlib import Path
+
+import pytest
+from PySide6.QtCore import QThreadPool
+from PySide6.QtWidgets import QApplication
+
+from rehearsal_track_markers import app_controller
+from rehearsal_track_markers.app_controller import AppController
+from rehearsal_track_markers.models import Marker, Show, Track
+from rehearsal_track_markers.persistence import FileManager
+from rehearsal_track_markers.ui import MainWindow
+
+# Ensure QApplication exists for Qt tests
+app = QApplication.instance() or QApplication([])
+
+
+def deliver_background_results() -> None:
+    """Wait for worker threads and deliver their queued signals."""
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+
+
+@pytest.fixture
+def controller(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> AppController:
+    """Create a controller that stores shows under a temporary directory."""
+    monkeypatch.setattr(
+        app_controller, "FileManager", lambda: FileManager(base_path=tmp_path)
+    )
+    window = MainWindow()
+    controller = AppController(window)
+    window.controller = controller
+
+    # No real audio is decoded in these tests
+    monkeypatch.setattr(controller._audio_player, "load_file", lambda path: None)
+    return controller
+
+
+class TestTrackSelection:
+    """Tests for switching between tracks."""
+
+    @staticmethod
+    def load_two_track_show(controller: AppController, tmp_path: Path) -> Show:
+        """Load a show with tracks A and B whose audio files exist."""
+        tracks = []
+        for name, timestamps in (("A", (0, 4000)), ("B", (6000,))):
+            audio_path = tmp_path / f"{name}.mp3"
+            audio_path.write_bytes(b"dummy audio")
+            tracks.append(
+                Track(
+                    filename=f"{name}.mp3",
+                    audio_path=audio_path,
+                    markers=[
+                        Marker(name=f"{name}{i}", timestamp_ms=ts)
+                        for i, ts in enumerate(timestamps)
+                    ],
+                )
+            )
+
+        show = Show(name="Test Show", tracks=tracks)
+        controller._current_show = show
+        controller._update_ui_for_show()
+        deliver_background_results()
+        return show
+
+    def test_marker_actions_target_displayed_track_until_check_completes(
+        self, controller: AppController, tmp_path: Path
+    ) -> None:
+        """Test that a nudge during a track switch edits the listed marker."""
+        show = self.load_two_track_show(controller, tmp_path)
+        track_a, track_b = show.tracks
+        assert controller._current_track is track_a
+
+        marker_list = controller._main_window.marker_list
+        marker_list.set_selected_marker(1)
+
+        # Select B, then nudge before its audio file check is delivered
+        controller._main_window.track_sidebar.set_selected_track(1)
+        controller._nudge_selected_marker(1)
+
+        assert controller._current_track is track_a
+        assert [m.timestamp_ms for m in track_a.markers] == [0, 4100]
+        assert [m.timestamp_ms for m in track_b.markers] == [6000]
+
+        deliver_background_results()
+
+        assert controller._current_track is track_b
+        assert controller._current_track_index == 1
+        assert marker_list.get_marker_count() == 1
+
+    def test_delete_ignored_when_track_switches_during_confirm(
+        self, controller: AppController, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Test that a track switch inside the confirm dialog cancels a delete."""
+        show = self.load_two_track_show(controller, tmp_path)
+        track_a, track_b = show.tracks
+
+        def confirm_after_switch(*args) -> bool:
+            # The dialog's event loop delivers the pending file check
+            deliver_background_results()
+            return True
+
+        monkeypatch.setattr(app_controller, "confirm", confirm_after_switch)
+
+        controller._main_window.track_sidebar.set_selected_track(1)
+        controller._on_delete_marker(0)
+
+        assert [m.name for m in track_a.markers] == ["A0", "A1"]
+        assert [m.name for m in track_b.markers] == ["B0"]
+        assert controller._current_track is track_b
+        assert controller._main_window.marker_list.get_marker_count() == 1
+
+    def test_missing_audio_keeps_current_track(
+        self, controller: AppController, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Test that selecting a track with missing audio leaves the old one active."""
+        monkeypatch.setattr(app_controller, "show_error", lambda *args: None)
+        show = self.load_two_track_show(controller, tmp_path)
+        show.tracks[1].audio_path.unlink()
+
+        controller._main_window.track_sidebar.set_selected_track(1)
+        deliver_background_results()
+
+        assert controller._current_track is show.tracks[0]
+        assert controller._current_track_index == 0
+
+
+class TestImportShow:
+    """Tests for importing a show with its audio files."""
+
+    def test_audio_found_outside_directory_listing(
+        self, controller: AppController, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Test that audio in a subdirectory of the audio folder is not missing."""
+        warnings = []
+        monkeypatch.setattr(
+            app_controller, "show_warning", lambda *args: warnings.append(args[1])
+        )
+        monkeypatch.setattr(app_controller, "show_info", lambda *args: None)
+
+        audio_dir = tmp_path / "import"
+        (audio_dir / "disc1").mkdir(parents=True)
+        (audio_dir / "disc1" / "A.mp3").write_bytes(b"dummy audio")
+
+        show = Show(
+            name="Imported",
+            tracks=[Track(filename="disc1/A.mp3", audio_path=audio_dir / "A.mp3")],
+        )
+        export_path = tmp_path / "export.json"
+        controller._show_repository.export_show(show, export_path)
+
+        controller._import_show_with_audio(export_path, audio_dir)
+
+        assert warnings == []
+        imported_track = controller._current_show.tracks[0]
+        assert imported_track.audio_path.read_bytes() == b"dummy audio"
+
+
+class TestAddTracks:
+    """Tests for adding audio files to a show."""
+
+    def test_copies_discarded_when_show_replaced(
+        self, controller: AppController, tmp_path: Path
+    ) -> None:
+        """Test that files copied for a replaced show are deleted."""
+        source = tmp_path / "new.mp3"
+        source.write_bytes(b"dummy audio")
+        show = Show(name="First")
+        controller._current_show = show
+
+        controller._add_audio_files([str(source)])
+        assert not controller._main_window.open_show_action.isEnabled()
+
+        # Replace the show before the copy result is delivered
+        controller._current_show = Show(name="Second")
+        controller._copy_pool.waitForDone()
+        QApplication.processEvents()
+
+        audio_dir = controller._file_manager.get_show_audio_directory("First")
+        assert list(audio_dir.iterdir()) == []
+        assert show.tracks == []
+        assert controller._main_window.open_show_action.isEnabled()
+
+    def test_copies_added_to_current_show(
+        self, controller: AppController, tmp_path: Path
+    ) -> None:
+        """Test that copied files become tracks of the show they were added to."""
+        source = tmp_path / "new.mp3"
+        source.write_bytes(b"dummy audio")
+        show = Show(name="First")
+        controller._current_show = show
+
+        controller._add_audio_files([str(source)])
+        controller._copy_pool.waitForDone()
+        QApplication.processEvents()
+
+        assert [track.filename for track in show.tracks] == ["new.mp3"]
+        assert show.tracks[0].audio_path.read_bytes() == b"dummy audio"
+        assert controller._main_window.statusBar().currentMessage() == ""
+
+
+class TestAutoSave:
+    """Tests for debounced auto-saving."""
+
+    def test_pending_save_flushed_on_exit(
+        self, controller: AppController, tmp_path: Path
+    ) -> None:
+        """Test that an edit still inside the debounce window is saved on exit."""
+        show = Show(name="Flushed")
+        controller._current_show = show
+
+        show.settings.skip_increment_seconds = 10
+        controller._trigger_auto_save(controller._marker_edit_debounce_ms)
+        assert controller._auto_save_timer.isActive()
+
+        controller._flush_pending_save()
+
+        assert not controller._auto_save_timer.isActive()
+        saved = controller._show_repository.load("Flushed")
+        assert saved.settings.skip_increment_seconds == 10
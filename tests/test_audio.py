@@ -44,6 +44,10 @@ class TestAudioFileManager:
         assert afm.is_supported_format(Path("song.MP3")) is True
         assert afm.is_supported_format(Path("song.WaV")) is True
 
+        # Plain string paths
+        assert afm.is_supported_format("/music/song.FLAC") is True
+        assert afm.is_supported_format("/music/notes.txt") is False
+
     def test_copy_audio_file(self) -> None:
         """Test copying an audio file to app storage."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -197,6 +201,43 @@ class TestAudioFileManager:
             # Should be different
             assert AudioFileManager._files_are_identical(file1, file3) is False
 
+    def test_copy_file(self) -> None:
+        """Test copying file contents and modification time."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "source.mp3"
+            dest = Path(tmpdir) / "dest.mp3"
+            content = bytes(range(256)) * 4096  # Spans several copy chunks
+            source.write_bytes(content)
+
+            AudioFileManager._copy_file(source, dest)
+
+            assert dest.read_bytes() == content
+            assert dest.stat().st_mtime == pytest.approx(source.stat().st_mtime)
+
+    def test_copy_file_does_not_overwrite(self) -> None:
+        """Test that copying onto an existing file fails and keeps it intact."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "source.mp3"
+            dest = Path(tmpdir) / "dest.mp3"
+            source.write_bytes(b"new audio")
+            dest.write_bytes(b"existing audio")
+
+            with pytest.raises(FileExistsError):
+                AudioFileManager._copy_file(source, dest)
+
+            assert dest.read_bytes() == b"existing audio"
+
+    def test_warm_file_cache(self) -> None:
+        """Test that prefetching tolerates present and missing files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "song.mp3"
+            self.create_dummy_audio_file(path)
+
+            # Only a hint: neither call may raise or modify the file
+            AudioFileManager.warm_file_cache(path)
+            AudioFileManager.warm_file_cache(Path(tmpdir) / "missing.mp3")
+            assert path.read_bytes() == b"dummy audio"
+
     def test_get_unique_filename(self) -> None:
         """Test generating unique filenames."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -214,6 +255,23 @@ class TestAudioFileManager:
             assert unique_path.name == "song_3.mp3"
             assert not unique_path.exists()
 
+    def test_get_unique_filename_ignores_case_and_normalization(self) -> None:
+        """Test that names differing only in case or Unicode form collide."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = Path(tmpdir)
+
+            (directory / "Song_1.mp3").touch()
+            (directory / "cafe\u0301_1.mp3").touch()  # NFD "café_1.mp3"
+
+            assert (
+                AudioFileManager._get_unique_filename(directory, "song.mp3").name
+                == "song_2.mp3"
+            )
+            assert (
+                AudioFileManager._get_unique_filename(directory, "caf\u00e9.mp3").name
+                == "caf\u00e9_2.mp3"
+            )
+
     def test_multiple_formats(self) -> None:
         """Test copying files with various audio formats."""
         with tempfile.TemporaryDirectory() as tmpdir:
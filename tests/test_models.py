@@ -50,6 +50,11 @@ class TestMarker:
         assert "Test" in result
         assert "2:" in result
 
+    def test_marker_str_rounding(self) -> None:
+        """Test that the displayed seconds keep their established rounding."""
+        assert str(Marker(name="Test", timestamp_ms=60015)) == "Test (1:00.02)"
+        assert str(Marker(name="Test", timestamp_ms=125125)) == "Test (2:05.12)"
+
 
 class TestTrack:
     """Tests for the Track model."""
@@ -92,6 +97,67 @@ class TestTrack:
         assert track.markers[1].name == "Middle"
         assert track.markers[2].name == "End"
 
+    def test_track_init_sorts_copy_of_markers(self) -> None:
+        """Test that construction sorts markers without reordering the input."""
+        markers = [
+            Marker(name="End", timestamp_ms=10000),
+            Marker(name="Start", timestamp_ms=0),
+        ]
+        track = Track(
+            filename="song.mp3", audio_path=Path("/path/to/song.mp3"), markers=markers
+        )
+
+        assert [m.name for m in track.markers] == ["Start", "End"]
+        assert [m.name for m in markers] == ["End", "Start"]
+
+    def test_track_init_rejects_duplicate_marker_names(self) -> None:
+        """Test that a track cannot be built with two markers of the same name."""
+        with pytest.raises(ValueError, match="Verse"):
+            Track(
+                filename="song.mp3",
+                audio_path=Path("/path/to/song.mp3"),
+                markers=[
+                    Marker(name="Verse", timestamp_ms=0),
+                    Marker(name="Verse", timestamp_ms=5000),
+                ],
+            )
+
+    def test_track_add_marker_returns_index(self) -> None:
+        """Test that add_marker reports where the marker was inserted."""
+        track = Track(filename="song.mp3", audio_path=Path("/path/to/song.mp3"))
+
+        assert track.add_marker(Marker(name="End", timestamp_ms=10000)) == 0
+        assert track.add_marker(Marker(name="Start", timestamp_ms=0)) == 0
+        assert track.add_marker(Marker(name="Middle", timestamp_ms=5000)) == 1
+        # Equal timestamps go after existing ones
+        assert track.add_marker(Marker(name="Also End", timestamp_ms=10000)) == 3
+
+    def test_track_marker_positions(self) -> None:
+        """Test that marker positions stay aligned with the marker list."""
+        track = Track(filename="song.mp3", audio_path=Path("/path/to/song.mp3"))
+        track.add_marker(Marker(name="End", timestamp_ms=10000))
+        track.add_marker(Marker(name="Start", timestamp_ms=0))
+        track.add_marker(Marker(name="Middle", timestamp_ms=5000))
+        assert track.marker_positions == [0, 5000, 10000]
+
+        track.remove_marker("Middle")
+        assert track.marker_positions == [0, 10000]
+
+    def test_track_set_marker_timestamp(self) -> None:
+        """Test that changing a timestamp keeps markers sorted."""
+        track = Track(filename="song.mp3", audio_path=Path("/path/to/song.mp3"))
+        track.add_marker(Marker(name="A", timestamp_ms=1000))
+        track.add_marker(Marker(name="B", timestamp_ms=2000))
+
+        assert track.set_marker_timestamp(0, 1500) == 0
+        assert track.markers[0].timestamp_ms == 1500
+
+        assert track.set_marker_timestamp(0, 2500) == 1
+        assert [m.name for m in track.markers] == ["B", "A"]
+        assert track.marker_positions == [2000, 2500]
+
+        assert track.set_marker_timestamp(5, 100) == -1
+
     def test_track_duplicate_marker_name(self) -> None:
         """Test that duplicate marker names raise ValueError."""
         track = Track(filename="song.mp3", audio_path=Path("/path/to/song.mp3"))
@@ -114,6 +180,20 @@ class TestTrack:
         result = track.remove_marker("NonExistent")
         assert result is False
 
+    def test_track_remove_marker_at(self) -> None:
+        """Test removing a marker by index."""
+        track = Track(filename="song.mp3", audio_path=Path("/path/to/song.mp3"))
+        track.add_marker(Marker(name="Intro", timestamp_ms=0))
+        track.add_marker(Marker(name="Outro", timestamp_ms=5000))
+
+        removed = track.remove_marker_at(0)
+        assert removed is not None and removed.name == "Intro"
+        assert not track.has_marker("Intro")
+        assert track.marker_positions == [5000]
+
+        assert track.remove_marker_at(5) is None
+        assert len(track.markers) == 1
+
     def test_track_get_marker(self) -> None:
         """Test getting a marker by name."""
         track = Track(filename="song.mp3", audio_path=Path("/path/to/song.mp3"))
@@ -145,6 +225,22 @@ class TestTrack:
         assert track.has_marker("NewName")
         assert not track.has_marker("OldName")
 
+    def test_track_marker_names(self) -> None:
+        """Test that the marker name set follows add, rename and remove."""
+        track = Track(
+            filename="song.mp3",
+            audio_path=Path("/path/to/song.mp3"),
+            markers=[Marker(name="Intro", timestamp_ms=0)],
+        )
+        assert track.marker_names == {"Intro"}
+
+        track.add_marker(Marker(name="Verse", timestamp_ms=1000))
+        track.rename_marker("Intro", "Opening")
+        assert track.marker_names == {"Opening", "Verse"}
+
+        track.remove_marker("Verse")
+        assert track.marker_names == {"Opening"}
+
     def test_track_rename_marker_duplicate(self) -> None:
         """Test that renaming to existing name raises ValueError."""
         track = Track(filename="song.mp3", audio_path=Path("/path/to/song.mp3"))
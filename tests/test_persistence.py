@@ -99,6 +99,18 @@ class TestFileManager:
             assert "Show B" in shows
             assert "Show C" in shows
 
+    def test_create_show_directories_after_delete(self) -> None:
+        """Test that show directories are recreated after the show is deleted."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fm = FileManager(base_path=Path(tmpdir))
+            fm.create_show_directories("Test Show")
+            fm.create_show_directories("Test Show")
+
+            fm.delete_show("Test Show")
+            fm.create_show_directories("Test Show")
+
+            assert fm.get_show_audio_directory("Test Show").is_dir()
+
     def test_delete_show(self) -> None:
         """Test deleting a show."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -127,6 +139,15 @@ class TestFileManager:
             result = fm.delete_show("Nonexistent Show")
             assert result is False
 
+    def test_snapshot_dir(self) -> None:
+        """Test listing directory entries in one pass."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "a.mp3").write_bytes(b"a")
+            (Path(tmpdir) / "sub").mkdir()
+
+            assert FileManager.snapshot_dir(Path(tmpdir)) == {"a.mp3", "sub"}
+            assert FileManager.snapshot_dir(Path(tmpdir) / "missing") == set()
+
 
 class TestShowRepository:
     """Tests for the ShowRepository class."""
@@ -161,6 +182,33 @@ class TestShowRepository:
             assert loaded_show.tracks[0].markers[0].name == "Intro"
             assert loaded_show.tracks[0].markers[1].name == "Chorus"
 
+    def test_save_skips_unchanged_show(self) -> None:
+        """Test that saving an unchanged show does not rewrite the file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fm = FileManager(base_path=Path(tmpdir))
+            repo = ShowRepository(file_manager=fm)
+
+            show = Show(name="Test Show")
+            repo.save(show)
+            show_file = fm.get_show_file_path("Test Show")
+            first_mtime = show_file.stat().st_mtime_ns
+
+            # Unchanged show leaves the file alone
+            repo.save(show)
+            assert show_file.stat().st_mtime_ns == first_mtime
+
+            # Changed show is written, with no temp file left behind
+            show.settings.skip_increment_seconds = 10
+            repo.save(show)
+            assert repo.load("Test Show").settings.skip_increment_seconds == 10
+            assert list(show_file.parent.glob("*.tmp")) == []
+
+            # Directory removed outside the app is recreated on save
+            fm.get_show_directory("Test Show").rename(Path(tmpdir) / "moved")
+            show.settings.skip_increment_seconds = 15
+            repo.save(show)
+            assert repo.load("Test Show").settings.skip_increment_seconds == 15
+
     def test_load_nonexistent_show(self) -> None:
         """Test loading a show that doesn't exist."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -1,5 +1,6 @@
 """Unit tests for UI components."""
 
+from PySide6.QtCore import Qt
 from PySide6.QtTest import QSignalSpy
 from PySide6.QtWidgets import QApplication
 
@@ -36,6 +37,14 @@ class TestTrackSidebar:
         sidebar.add_track("Track 2")
         assert sidebar.get_track_count() == 2
 
+    def test_add_tracks(self) -> None:
+        """Test adding several tracks at once."""
+        sidebar = TrackSidebar()
+        sidebar.add_track("Track 1")
+
+        sidebar.add_tracks(["Track 2", "Track 3"])
+        assert sidebar.get_track_count() == 3
+
     def test_remove_track(self) -> None:
         """Test removing tracks from the sidebar."""
         sidebar = TrackSidebar()
@@ -72,6 +81,18 @@ class TestTrackSidebar:
         # First track should be auto-selected
         assert sidebar.get_selected_index() == 0
 
+    def test_set_tracks_replaces_and_emits_once(self) -> None:
+        """Test that repopulating the list emits a single selection signal."""
+        sidebar = TrackSidebar()
+        sidebar.set_tracks(["Old 1", "Old 2"])
+
+        selection_spy = QSignalSpy(sidebar.track_selected)
+        sidebar.set_tracks(name for name in ["New 1", "New 2", "New 3"])
+
+        assert sidebar.get_track_count() == 3
+        assert sidebar.get_selected_index() == 0
+        assert selection_spy.count() == 1
+
     def test_track_selection(self) -> None:
         """Test track selection."""
         sidebar = TrackSidebar()
@@ -127,6 +148,41 @@ class TestPlaybackControls:
         controls.set_duration(120000)  # 2 minutes
         assert controls._progress_slider.maximum() == 120000
 
+    def test_tick(self) -> None:
+        """Test that tick moves the slider and refreshes the time display."""
+        controls = PlaybackControls()
+        controls.set_duration(120000)
+
+        controls.tick(61500, 120000)
+        assert controls._progress_slider.value() == 61500
+        assert controls._time_label.text() == "1:01 / 2:00"
+
+        controls.tick(61900, 120000)
+        assert controls._progress_slider.value() == 61900
+        assert controls._time_label.text() == "1:01 / 2:00"
+
+    def test_set_markers_delta(self) -> None:
+        """Test incremental marker updates on the progress bar."""
+        controls = PlaybackControls()
+        controls.set_markers([3000, 1000])
+
+        controls.set_markers_delta([2000], [])
+        assert controls._progress_slider._marker_positions == [1000, 2000, 3000]
+
+        controls.set_markers_delta([2500], [1000, 9999])
+        assert controls._progress_slider._marker_positions == [2000, 2500, 3000]
+
+    def test_set_markers_copies_positions(self) -> None:
+        """Test that the progress bar never aliases the caller's list."""
+        controls = PlaybackControls()
+        positions = [1000, 2000]
+        controls.set_markers(positions)
+
+        controls.set_markers_delta([1500], [])
+
+        assert positions == [1000, 2000]
+        assert controls._progress_slider._marker_positions == [1000, 1500, 2000]
+
     def test_time_formatting(self) -> None:
         """Test time formatting."""
         # 0 seconds
@@ -227,6 +283,66 @@ class TestMarkerList:
         marker_list.add_marker("Marker 2", 2000)
         assert marker_list.get_marker_count() == 2
 
+    def test_insert_marker(self) -> None:
+        """Test inserting a marker at a given row."""
+        marker_list = MarkerList()
+        marker_list.add_marker("Start", 0)
+        marker_list.add_marker("End", 9000)
+
+        marker_list.insert_marker(1, "Middle", 5000)
+
+        assert marker_list.get_marker_count() == 3
+        assert marker_list._marker_list.item(1).text() == "Middle"
+        assert marker_list._marker_list.item(2).text() == "End"
+
+    def test_set_markers_replaces_list(self) -> None:
+        """Test that set_markers replaces the list and resets the buttons."""
+        marker_list = MarkerList()
+        marker_list.add_marker("Old", 500)
+        marker_list.set_selected_marker(0)
+        assert marker_list._edit_button.isEnabled()
+
+        marker_list.set_markers((name, ts) for name, ts in [("A", 0), ("B", 1000)])
+
+        assert marker_list.get_marker_count() == 2
+        assert marker_list._marker_list.item(0).text() == "A"
+        assert marker_list.get_selected_index() == -1
+        assert not marker_list._edit_button.isEnabled()
+        assert not marker_list._delete_button.isEnabled()
+
+    def test_update_marker_skips_unchanged_text(self) -> None:
+        """Test that updating only the timestamp leaves the item text alone."""
+        marker_list = MarkerList()
+        marker_list.add_marker("Verse", 1000)
+        spy = QSignalSpy(marker_list._marker_list.itemChanged)
+
+        assert marker_list.update_marker(0, "Verse", 1100) is True
+
+        item = marker_list._marker_list.item(0)
+        assert item.data(Qt.ItemDataRole.UserRole) == 1100
+        assert spy.count() == 1  # Timestamp only
+
+        assert marker_list.update_marker(0, "Verse", 1100) is True
+        assert spy.count() == 1  # Nothing changed
+
+    def test_move_marker(self) -> None:
+        """Test moving a marker to another row."""
+        marker_list = MarkerList()
+        marker_list.set_markers([("A", 0), ("B", 1000), ("C", 2000)])
+        marker_list.set_selected_marker(0)
+        spy = QSignalSpy(marker_list.marker_selected)
+
+        assert marker_list.move_marker(0, 2) is True
+
+        texts = [marker_list._marker_list.item(i).text() for i in range(3)]
+        assert texts == ["B", "C", "A"]
+        assert marker_list.get_selected_index() == 2
+        # Only the final selection is reported
+        assert spy.count() == 1
+        assert spy.at(0) == [2]
+
+        assert marker_list.move_marker(0, 5) is False
+
     def test_remove_marker(self) -> None:
         """Test removing markers from the list."""
         marker_list = MarkerList()
@@ -371,6 +487,20 @@ class TestMainWindow:
         assert min_size.width() == 800
         assert min_size.height() == 600
 
+    def test_set_busy(self) -> None:
+        """Test that busy state disables show switching and adding tracks."""
+        window = MainWindow()
+
+        window.set_busy("Copying 2 audio file(s)...")
+        assert window.statusBar().currentMessage() == "Copying 2 audio file(s)..."
+        assert not window.open_show_action.isEnabled()
+        assert not window.track_sidebar._add_track_button.isEnabled()
+
+        window.set_busy(None)
+        assert window.statusBar().currentMessage() == ""
+        assert window.open_show_action.isEnabled()
+        assert window.track_sidebar._add_track_button.isEnabled()
+
     def test_menu_bar_exists(self) -> None:
         """Test that menu bar is created."""
         window = MainWindow()
@@ -1,5 +1,6 @@
 # This Python file uses the following encoding: utf-8
 """Entry point for the Rehearsal Track Marker application."""
+import os
 import sys
 
 from PySide6.QtWidgets import QApplication
@@ -15,6 +16,11 @@ def main() -> int:
     Returns:
         Exit code
     """
+    # No widgets in this app overlap their siblings, so Qt's per-repaint
+    # search for opaque siblings to clip away never pays off. Must be set
+    # before QApplication is created; an explicit user setting wins.
+    os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
+
     app = QApplication(sys.argv)
 
     # Create main window